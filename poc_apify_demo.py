@@ -18,6 +18,9 @@ from dotenv import load_dotenv
 
 from scrapers.apify_client import fetch_posts
 
+# Precomputed table that flattens line breaks for single-line previews.
+_NL_TRANS = str.maketrans({"\n": " "})
+
 
 def load_env() -> None:
     """
@@ -44,7 +47,7 @@ def run_demo(profile_urls: List[str] | None = None) -> None:
     print(f"Fetched {len(posts)} posts.")
     for idx, post in enumerate(posts[:3], start=1):
         post_id = post.get("id") or post.get("postId")
-        text = (post.get("text") or post.get("postText") or "")[:200].replace("\n", " ")
+        text = (post.get("text") or post.get("postText") or "")[:200].translate(_NL_TRANS)
         print(f"{idx}. id={post_id} text={text!r}")
 
 
@@ -28,6 +28,8 @@ from dotenv import load_dotenv
 
 from x_auto.x_api.x_client import post_reply
 
+_STATUS_ID_RE = re.compile(r"status/(\d+)")
+
 
 def load_env() -> None:
     """
@@ -56,7 +58,7 @@ def extract_post_id(post_url_or_id: str) -> str:
     if post_url_or_id.isdigit():
         return post_url_or_id
 
-    match = re.search(r"status/(\d+)", post_url_or_id)
+    match = _STATUS_ID_RE.search(post_url_or_id)
     if match:
         return match.group(1)
 
@@ -13,18 +13,68 @@ Example:
 from __future__ import annotations
 
 import os
-from typing import Dict, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional
 
 import requests
 
-APIFY_RUN_URL = (
-    "https://api.apify.com/v2/acts/"
-    "scraper_one~x-profile-posts-scraper/run-sync-get-dataset-items"
+from x_auto.utils.http import PostSafeRetry, json_body, json_loads, pooled_session
+
+APIFY_API_BASE = "https://api.apify.com/v2"
+APIFY_ACTOR_ID = "scraper_one~x-profile-posts-scraper"
+APIFY_RUN_URL = f"{APIFY_API_BASE}/acts/{APIFY_ACTOR_ID}/run-sync-get-dataset-items"
+APIFY_START_RUN_URL = f"{APIFY_API_BASE}/acts/{APIFY_ACTOR_ID}/runs"
+
+# Run states that mean the actor has not finished yet.
+_ACTIVE_RUN_STATUSES = frozenset({"READY", "RUNNING", "TIMING-OUT", "ABORTING"})
+
+
+# Shared across calls so repeated actor runs reuse the same keep-alive
+# connection to api.apify.com instead of paying a new TLS handshake each time.
+# Actor-starting POSTs may already have launched a billed run when a 5xx comes
+# back, so only GETs are retried on gateway errors.
+_RETRY = PostSafeRetry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
 )
+_SESSION = pooled_session(pool_connections=4, pool_maxsize=16, retry=_RETRY)
+
+
+def _get_token() -> str:
+    """
+    Read the Apify API token from the environment.
+
+    Raises:
+        ValueError: If the APIFY_TOKEN environment variable is missing.
+    """
+    token = os.getenv("APIFY_TOKEN")
+    if not token:
+        raise ValueError("APIFY_TOKEN environment variable is required but missing.")
+    return token
+
+
+def _raise_for_status(response: requests.Response) -> None:
+    """
+    Raise an HTTPError carrying the Apify response body for non-2xx statuses.
+    """
+    if not 200 <= response.status_code < 300:
+        message = (
+            f"Apify request failed with status {response.status_code}: "
+            f"{response.text}"
+        )
+        raise requests.HTTPError(message, response=response)
 
 
 def fetch_posts(
-    profile_urls: List[str], results_limit: int = 20, timeout_seconds: int = 600
+    profile_urls: List[str],
+    results_limit: int = 20,
+    timeout_seconds: int = 600,
+    session: Optional[requests.Session] = None,
+    token: Optional[str] = None,
 ) -> List[Dict]:
     """
     Call the Apify actor to retrieve recent posts for the given X profile URLs.
@@ -32,6 +82,10 @@ def fetch_posts(
     Args:
         profile_urls: List of full X profile URLs (e.g., https://x.com/handle).
         results_limit: Maximum number of posts to retrieve per profile.
+        timeout_seconds: Read timeout for the synchronous actor run.
+        session: Optional requests session to send the call through. Defaults to
+            the module-level pooled session.
+        token: Optional Apify API token. Defaults to the APIFY_TOKEN environment variable.
 
     Returns:
         A list of post dictionaries as returned by the Apify actor.
@@ -40,21 +94,131 @@ def fetch_posts(
         ValueError: If the APIFY_TOKEN environment variable is missing.
         requests.HTTPError: If the Apify API response status is not 200.
     """
-    token = os.getenv("APIFY_TOKEN")
-    if not token:
-        raise ValueError("APIFY_TOKEN environment variable is required but missing.")
-
     payload = {"profileUrls": profile_urls, "resultsLimit": results_limit}
-    params = {"token": token}
+    params = {"token": token or _get_token()}
 
-    response = requests.post(
-        APIFY_RUN_URL, params=params, json=payload, timeout=timeout_seconds
+    http = session or _SESSION
+    response = http.post(
+        APIFY_RUN_URL, params=params, timeout=timeout_seconds, **json_body(payload)
     )
-    if not 200 <= response.status_code < 300:
-        message = (
-            f"Apify request failed with status {response.status_code}: "
-            f"{response.text}"
+    _raise_for_status(response)
+
+    return json_loads(response.content)
+
+
+def fetch_posts_streaming(
+    profile_urls: List[str],
+    results_limit: int = 20,
+    page_size: int = 100,
+    timeout_seconds: int = 600,
+    session: Optional[requests.Session] = None,
+    is_recent: Optional[Callable[[Dict], bool]] = None,
+) -> Iterator[Dict]:
+    """
+    Start an asynchronous actor run and yield its dataset items page by page.
+
+    Unlike `fetch_posts`, no single HTTP request has to stay open for the whole
+    actor run: the run is started, awaited via Apify's long-poll `waitForFinish`,
+    and its dataset is then read in `page_size` chunks, so callers can start
+    processing before every item has been downloaded.
+
+    Args:
+        profile_urls: List of full X profile URLs (e.g., https://x.com/handle).
+        results_limit: Maximum number of posts to retrieve per profile.
+        page_size: Number of dataset items requested per page.
+        timeout_seconds: Maximum time to wait for the actor run to finish.
+        session: Optional requests session to send the calls through. Defaults to
+            the module-level pooled session.
+        is_recent: Optional predicate telling whether a post is inside the
+            caller's lookback window. Posts failing it are skipped, and paging
+            stops at the first page with no recent post (the actor returns
+            newest first; a single old pinned post does not end the scan).
+
+    Yields:
+        Post dictionaries as returned by the Apify actor.
+
+    Raises:
+        ValueError: If the APIFY_TOKEN environment variable is missing.
+        requests.HTTPError: If any Apify API response status is not 2xx.
+        TimeoutError: If the run does not finish within `timeout_seconds`.
+        RuntimeError: If the run finishes with a status other than SUCCEEDED.
+    """
+    params = {"token": _get_token()}
+    http = session or _SESSION
+
+    payload = {"profileUrls": profile_urls, "resultsLimit": results_limit}
+    response = http.post(APIFY_START_RUN_URL, params=params, timeout=30, **json_body(payload))
+    _raise_for_status(response)
+    run = json_loads(response.content)["data"]
+
+    deadline = time.monotonic() + timeout_seconds
+    while run["status"] in _ACTIVE_RUN_STATUSES:
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Apify run {run['id']} did not finish within {timeout_seconds}s.")
+        response = http.get(
+            f"{APIFY_API_BASE}/actor-runs/{run['id']}",
+            params={**params, "waitForFinish": 60},
+            timeout=90,
         )
-        raise requests.HTTPError(message, response=response)
+        _raise_for_status(response)
+        run = json_loads(response.content)["data"]
+
+    if run["status"] != "SUCCEEDED":
+        raise RuntimeError(f"Apify run {run['id']} finished with status {run['status']}.")
 
-    return response.json()
+    items_url = f"{APIFY_API_BASE}/datasets/{run['defaultDatasetId']}/items"
+    offset = 0
+    while True:
+        response = http.get(
+            items_url,
+            params={**params, "format": "json", "clean": "true", "offset": offset, "limit": page_size},
+            timeout=60,
+        )
+        _raise_for_status(response)
+        page = json_loads(response.content)
+        if is_recent is None:
+            yield from page
+        else:
+            recent = [post for post in page if is_recent(post)]
+            yield from recent
+            if page and not recent:
+                return
+        if len(page) < page_size:
+            return
+        offset += len(page)
+
+
+def fetch_posts_by_urls(
+    profile_urls: List[str],
+    results_limit: int = 20,
+    max_workers: Optional[int] = None,
+) -> Dict[str, List[Dict]]:
+    """
+    Fetch posts for each profile URL with one actor run per profile, concurrently.
+
+    Each run is pure network wait, so overlapping them makes the wall time close
+    to the slowest profile rather than the sum of all of them.
+
+    Args:
+        profile_urls: List of full X profile URLs.
+        results_limit: Maximum number of posts to retrieve per profile.
+        max_workers: Maximum concurrent actor runs. Defaults to the
+            APIFY_CONCURRENCY environment variable (or 5).
+
+    Returns:
+        A mapping of profile URL to its list of posts, in the order of `profile_urls`.
+
+    Raises:
+        ValueError: If the APIFY_TOKEN environment variable is missing.
+        requests.HTTPError: If any Apify run fails.
+    """
+    if not profile_urls:
+        return {}
+
+    workers = max_workers or int(os.getenv("APIFY_CONCURRENCY", "5") or 5)
+    workers = max(1, min(workers, len(profile_urls)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="apify") as executor:
+        results = executor.map(
+            lambda url: fetch_posts([url], results_limit=results_limit), profile_urls
+        )
+        return dict(zip(profile_urls, results))
@@ -7,6 +7,16 @@ from typing import Dict, Optional
 from dotenv import load_dotenv
 import os
 
+# Credential dictionary keys paired with the environment variables they come from.
+_CREDENTIAL_ENV_VARS = (
+    ("apify_token", "APIFY_TOKEN"),
+    ("google_service_account_path", "GOOGLE_SERVICE_ACCOUNT_PATH"),
+    ("x_api_key", "X_API_KEY"),
+    ("x_api_secret", "X_API_SECRET"),
+    ("x_access_token", "X_ACCESS_TOKEN"),
+    ("x_access_token_secret", "X_ACCESS_TOKEN_SECRET"),
+)
+
 
 def load_environment(dotenv_path: Optional[str] = ".env") -> None:
     """
@@ -29,11 +39,5 @@ def get_api_credentials() -> Dict[str, str]:
     Returns:
         A dictionary containing tokens and keys sourced from environment variables.
     """
-    return {
-        "apify_token": os.getenv("APIFY_TOKEN", ""),
-        "google_service_account_path": os.getenv("GOOGLE_SERVICE_ACCOUNT_PATH", ""),
-        "x_api_key": os.getenv("X_API_KEY", ""),
-        "x_api_secret": os.getenv("X_API_SECRET", ""),
-        "x_access_token": os.getenv("X_ACCESS_TOKEN", ""),
-        "x_access_token_secret": os.getenv("X_ACCESS_TOKEN_SECRET", ""),
-    }
+    env = os.environ
+    return {key: env.get(var, "") for key, var in _CREDENTIAL_ENV_VARS}
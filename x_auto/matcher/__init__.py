@@ -2,4 +2,8 @@
 Keyword matching, scoring rules, and template selection utilities.
 """
 
-from x_auto.matcher.keyword_matcher import match_keywords, score_matches  # noqa: F401
+from x_auto.matcher.keyword_matcher import (  # noqa: F401
+    match_keywords,
+    prepare_keyword_rows,
+    score_matches,
+)
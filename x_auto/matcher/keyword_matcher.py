@@ -18,6 +18,35 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+# Key under which prepare_keyword_rows stores the stripped, lowercased keyword.
+_PREPARED_KEY = "_keyword_lower"
+
+
+def _normalize_keyword(keyword_raw: Any) -> str:
+    """Return the stripped, lowercased keyword, or "" for blank/non-string values."""
+    if not isinstance(keyword_raw, str):
+        return ""
+    return keyword_raw.strip().lower()
+
+
+def prepare_keyword_rows(keyword_rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Normalize keyword rows once so repeated matching skips per-call string work.
+
+    Args:
+        keyword_rows: Keyword dictionaries sourced from Sheets.
+
+    Returns:
+        Copies of the rows with a usable keyword, each carrying its stripped,
+        lowercased keyword. Pass the result to `match_keywords` for every post.
+    """
+    prepared: List[Dict[str, Any]] = []
+    for row in keyword_rows:
+        keyword = _normalize_keyword(row.get("keyword", ""))
+        if keyword:
+            prepared.append({**row, _PREPARED_KEY: keyword})
+    return prepared
+
 
 def match_keywords(text: str, keyword_rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
@@ -27,7 +56,8 @@ def match_keywords(text: str, keyword_rows: List[Dict[str, Any]]) -> List[Dict[s
         text: Tweet or post body to scan for keywords.
         keyword_rows: List of dictionaries sourced from Sheets, each expected to
             contain a "keyword" field and optionally other metadata (e.g., weight,
-            template references).
+            template references). Rows returned by `prepare_keyword_rows` reuse
+            their precomputed keyword instead of normalizing it again.
 
     Returns:
         A list of row dictionaries that matched the provided text.
@@ -36,15 +66,10 @@ def match_keywords(text: str, keyword_rows: List[Dict[str, Any]]) -> List[Dict[s
     matches: List[Dict[str, Any]] = []
 
     for row in keyword_rows:
-        keyword_raw = row.get("keyword", "")
-        if not isinstance(keyword_raw, str):
-            continue
-
-        keyword = keyword_raw.strip()
-        if not keyword:
-            continue
-
-        if keyword.lower() in lowered:
+        keyword = row.get(_PREPARED_KEY)
+        if keyword is None:
+            keyword = _normalize_keyword(row.get("keyword", ""))
+        if keyword and keyword in lowered:
             matches.append(row)
 
     return matches
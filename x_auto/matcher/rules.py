@@ -2,7 +2,36 @@
 Rules for keyword detection, scoring, and determining reply eligibility.
 """
 
-from typing import Dict, List, Sequence
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+
+
+@lru_cache(maxsize=32)
+def _compile_keywords(keywords: Tuple[str, ...]) -> Tuple[Optional[Pattern[str]], Dict[str, str]]:
+    """
+    Compile a keyword set into one case-insensitive alternation, once per set.
+
+    Keywords are ordered longest first so overlapping terms prefer the longer
+    match, and bounded by non-word lookarounds so terms like "$BTC" still work.
+
+    Args:
+        keywords: Keyword strings as supplied by the caller.
+
+    Returns:
+        The compiled pattern (None when no usable keywords) and a mapping of
+        lowercased keyword to the original spelling.
+    """
+    originals: Dict[str, str] = {}
+    for keyword in keywords:
+        normalized = keyword.strip().lower() if isinstance(keyword, str) else ""
+        if normalized:
+            originals.setdefault(normalized, keyword)
+    if not originals:
+        return None, originals
+
+    alternation = "|".join(re.escape(k) for k in sorted(originals, key=len, reverse=True))
+    return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE), originals
 
 
 def match_keywords(
@@ -12,14 +41,24 @@ def match_keywords(
     """
     Identify which keywords appear in a post's text.
 
+    Matching is case-insensitive and on whole words. All keywords are scanned
+    in a single regex pass per post, and the compiled pattern is cached per
+    keyword set.
+
     Args:
         post_text: Body text of the X post to evaluate.
         keywords: Sequence of keyword strings to search for.
 
     Returns:
-        A mapping containing matched keywords and any supporting metadata.
+        A mapping with a "matched" list of the keywords (as supplied) found in
+        the text, in order of first appearance.
     """
-    raise NotImplementedError("Keyword matching is not yet implemented.")
+    pattern, originals = _compile_keywords(tuple(keywords))
+    if pattern is None:
+        return {"matched": []}
+
+    found = dict.fromkeys(match.group(0).lower() for match in pattern.finditer(post_text))
+    return {"matched": [originals[k] for k in found if k in originals]}
 
 
 def score_post(match_result: Dict[str, List[str]], base_score: float = 0.0) -> float:
@@ -2,8 +2,15 @@
 Builds reply messages from templates and dynamic content.
 """
 
+import re
 from typing import Dict
 
+# X's weighted-length rules: URLs count as a fixed 23, code points in these
+# ranges (Latin, common punctuation, etc.) count 1, everything else counts 2.
+_URL_RE = re.compile(r"https?://\S+", re.IGNORECASE)
+_URL_WEIGHT = 23
+_SINGLE_WEIGHT_RANGES = ((0, 4351), (8192, 8205), (8208, 8223), (8242, 8247))
+
 
 def build_reply(template: Dict[str, str], context: Dict[str, str]) -> str:
     """
@@ -19,15 +26,41 @@ def build_reply(template: Dict[str, str], context: Dict[str, str]) -> str:
     raise NotImplementedError("Reply building is not yet implemented.")
 
 
+def _char_weight(char: str) -> int:
+    """Return the X weight (1 or 2) of a single character."""
+    code_point = ord(char)
+    for low, high in _SINGLE_WEIGHT_RANGES:
+        if low <= code_point <= high:
+            return 1
+    return 2
+
+
+def weighted_length(text: str) -> int:
+    """
+    Approximate X's weighted character count (URLs fixed, CJK/emoji doubled).
+    """
+    total = 0
+    last = 0
+    for match in _URL_RE.finditer(text):
+        total += sum(_char_weight(c) for c in text[last : match.start()]) + _URL_WEIGHT
+        last = match.end()
+    return total + sum(_char_weight(c) for c in text[last:])
+
+
 def validate_reply(reply_text: str, max_length: int = 280) -> bool:
     """
     Validate that the reply meets platform constraints and safety checks.
 
+    Length is measured the way X counts it. No character weighs more than 2,
+    so short replies without URLs are accepted without the weighted scan.
+
     Args:
         reply_text: The reply text to validate.
-        max_length: Maximum character length allowed for replies.
+        max_length: Maximum weighted length allowed for replies.
 
     Returns:
         True if the reply is acceptable, otherwise False.
     """
-    return len(reply_text) <= max_length
+    if len(reply_text) * 2 <= max_length and "://" not in reply_text:
+        return True
+    return weighted_length(reply_text) <= max_length
@@ -1,9 +1,14 @@
 """
 Integration with the Apify actor `scraper_one/x-profile-posts-scraper`.
+
+HTTP calls are delegated to `scrapers.apify_client`, so both entry points share
+one pooled session, retry policy, and JSON codec.
 """
 
 from typing import Any, Dict, List, Optional
 
+from scrapers.apify_client import fetch_posts
+
 
 def fetch_recent_posts(
     apify_token: str,
@@ -21,6 +26,19 @@ def fetch_recent_posts(
         limit: Maximum number of posts to request.
 
     Returns:
-        A list of normalized post dictionaries including id, text, timestamps, and URLs.
+        A list of post dictionaries as returned by the actor, newer than
+        `since_id` when provided.
     """
-    raise NotImplementedError("Apify scraping is not yet implemented.")
+    profile_url = f"https://x.com/{handle.strip().lstrip('@')}"
+    posts = fetch_posts([profile_url], results_limit=limit, token=apify_token or None)
+    if not since_id or not str(since_id).isdigit():
+        return posts
+
+    # X post IDs are Snowflakes, so numeric order is chronological order.
+    floor = int(since_id)
+    newer: List[Dict[str, Any]] = []
+    for post in posts:
+        post_id = str(post.get("id") or post.get("postId") or "")
+        if post_id.isdigit() and int(post_id) > floor:
+            newer.append(post)
+    return newer
@@ -12,18 +12,34 @@ Example:
 
 from __future__ import annotations
 
+import atexit
 import os
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import gspread
 from google.oauth2.service_account import Credentials
+from gspread.utils import numericise_all
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 DEFAULT_SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/drive",
 ]
 
+# Reads are retried on quota (429) and transient server errors, honouring
+# Retry-After. Writes are not retried so a slow append cannot land twice.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+
 
 class GoogleSheetsClient:
     """
@@ -40,6 +56,12 @@ class GoogleSheetsClient:
           by the provided spreadsheet name.
         - Exposes helper methods for fetching worksheets, reading records, and
           appending rows with type hints for clarity.
+        - Caches `read_records` results per worksheet for `cache_ttl_seconds`
+          (0 disables caching); appending to a worksheet invalidates its entry.
+        - Caches `read_column` results the same way, but extends them in place
+          with appended rows instead of dropping them.
+        - Buffers rows passed to `queue_append` until `flush` (also run at exit),
+          writing each worksheet's rows with one `append_rows` call.
 
     Example usage:
         client = GoogleSheetsClient(spreadsheet_name="Automation Config")
@@ -52,7 +74,20 @@ class GoogleSheetsClient:
         `1gr9wMTJTDEFlsqGF8nSMJ4fXyBjNP2RvTdVyWvmuG00`.
     """
 
-    def __init__(self, spreadsheet_name: str, spreadsheet_id: str | None = None):
+    def __init__(
+        self,
+        spreadsheet_name: str,
+        spreadsheet_id: str | None = None,
+        cache_ttl_seconds: float = 60.0,
+    ):
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._record_cache: Dict[Tuple[str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._pending: Dict[str, List[List[Any]]] = {}
+        self._ws_cache: Dict[str, Any] = {}
+        # (sheet, header) -> (fetched_at, column index, values below the header)
+        self._column_cache: Dict[Tuple[str, str], Tuple[float, int, List[str]]] = {}
+        self._exit_hook = False
+
         service_account_path = os.getenv("GOOGLE_SERVICE_ACCOUNT_PATH")
         if not service_account_path:
             raise RuntimeError("GOOGLE_SERVICE_ACCOUNT_PATH is required but missing.")
@@ -61,11 +96,7 @@ class GoogleSheetsClient:
         if not credentials_path.is_file():
             raise RuntimeError(f"Service account file not found at {credentials_path}")
 
-        credentials = Credentials.from_service_account_file(
-            str(credentials_path),
-            scopes=DEFAULT_SCOPES,
-        )
-        client = gspread.authorize(credentials)
+        client = _authorized_client(str(credentials_path))
 
         env_spreadsheet_id = os.getenv("GOOGLE_X_ACCOUNT_ID")
         spreadsheet_id = spreadsheet_id or env_spreadsheet_id
@@ -84,6 +115,9 @@ class GoogleSheetsClient:
         """
         Retrieve a worksheet by name.
 
+        Handles are memoized. The first miss lists every worksheet in one
+        metadata request and caches them all, so later names cost nothing.
+
         Args:
             sheet_name: Name of the worksheet to fetch.
 
@@ -93,15 +127,51 @@ class GoogleSheetsClient:
         Raises:
             RuntimeError: If the worksheet cannot be located.
         """
+        worksheet = self._ws_cache.get(sheet_name)
+        if worksheet is not None:
+            return worksheet
+
+        for candidate in self.spreadsheet.worksheets():
+            self._ws_cache[candidate.title] = candidate
         try:
-            return self.spreadsheet.worksheet(sheet_name)
-        except gspread.WorksheetNotFound as exc:
+            return self._ws_cache[sheet_name]
+        except KeyError as exc:
             raise RuntimeError(f"Worksheet '{sheet_name}' not found.") from exc
 
     def read_records(self, sheet_name: str) -> List[Dict[str, Any]]:
         """
         Read all rows from a worksheet as a list of dictionaries.
 
+        Results are served from the in-memory cache while younger than
+        `cache_ttl_seconds`, so repeated reads in one run cost one API call.
+
+        Args:
+            sheet_name: Name of the worksheet to read.
+
+        Returns:
+            A list where each element represents a row keyed by column header.
+
+        Raises:
+            RuntimeError: If the worksheet cannot be located.
+        """
+        key = (self.spreadsheet.id, sheet_name)
+        cached = self._record_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl_seconds:
+            return list(cached[1])
+
+        worksheet = self.get_sheet(sheet_name)
+        records = worksheet.get_all_records()
+        if self.cache_ttl_seconds > 0:
+            self._record_cache[key] = (time.monotonic(), records)
+        return list(records)
+
+    def read_records_fast(self, sheet_name: str) -> List[Dict[str, str]]:
+        """
+        Read all rows as dictionaries of raw strings, skipping type inference.
+
+        Use this where values are only compared as text (IDs, URLs); numeric
+        cells stay strings. Results are not cached.
+
         Args:
             sheet_name: Name of the worksheet to read.
 
@@ -112,7 +182,109 @@ class GoogleSheetsClient:
             RuntimeError: If the worksheet cannot be located.
         """
         worksheet = self.get_sheet(sheet_name)
-        return worksheet.get_all_records()
+        return _values_to_records(worksheet.get_all_values(), numericise=False)
+
+    def read_column(self, sheet_name: str, header: str) -> List[str]:
+        """
+        Read the values under one header without fetching the whole worksheet.
+
+        The column is cached for `cache_ttl_seconds` and kept current by this
+        client's own appends, so repeated reads normally cost no API call.
+
+        Args:
+            sheet_name: Name of the worksheet to read.
+            header: Column header (first-row value) to look up.
+
+        Returns:
+            The column's values below the header row; empty when the header is
+            not present.
+
+        Raises:
+            RuntimeError: If the worksheet cannot be located.
+        """
+        key = (sheet_name, header)
+        cached = self._column_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl_seconds:
+            return list(cached[2])
+
+        worksheet = self.get_sheet(sheet_name)
+        header_row = worksheet.row_values(1)
+        if header not in header_row:
+            return []
+        index = header_row.index(header)
+        values = worksheet.col_values(index + 1)[1:]
+        if self.cache_ttl_seconds > 0:
+            self._column_cache[key] = (time.monotonic(), index, values)
+        return list(values)
+
+    def read_many_records(self, sheet_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Read several worksheets as dictionaries with a single values.batchGet call.
+
+        Worksheets still held in the record cache are served from it; only the
+        remaining ones are fetched, and the results are cached like `read_records`.
+
+        Args:
+            sheet_names: Names of the worksheets to read.
+
+        Returns:
+            A mapping of worksheet name to its rows keyed by column header.
+
+        Raises:
+            RuntimeError: If any of the worksheets cannot be read.
+        """
+        now = time.monotonic()
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        missing: List[str] = []
+        for name in dict.fromkeys(sheet_names):
+            cached = self._record_cache.get((self.spreadsheet.id, name))
+            if cached is not None and now - cached[0] < self.cache_ttl_seconds:
+                results[name] = list(cached[1])
+            else:
+                missing.append(name)
+
+        if missing:
+            ranges = ["'" + name.replace("'", "''") + "'" for name in missing]
+            try:
+                response = self.spreadsheet.values_batch_get(ranges=ranges)
+            except gspread.exceptions.APIError as exc:
+                raise RuntimeError(f"Failed to read worksheets {missing}: {exc}") from exc
+
+            fetched_at = time.monotonic()
+            value_ranges = response.get("valueRanges", [])
+            for name, value_range in zip(missing, value_ranges):
+                records = _values_to_records(value_range.get("values", []))
+                if self.cache_ttl_seconds > 0:
+                    self._record_cache[(self.spreadsheet.id, name)] = (fetched_at, records)
+                results[name] = list(records)
+
+        return results
+
+    def invalidate(self, sheet_name: Optional[str] = None) -> None:
+        """
+        Drop cached records so the next read hits the Sheets API.
+
+        Args:
+            sheet_name: Worksheet whose cache entry to drop. Clears every entry
+                when omitted.
+
+        Returns:
+            None.
+        """
+        if sheet_name is None:
+            self._record_cache.clear()
+            self._column_cache.clear()
+            return
+        self._record_cache.pop((self.spreadsheet.id, sheet_name), None)
+        for key in [key for key in self._column_cache if key[0] == sheet_name]:
+            del self._column_cache[key]
+
+    def _record_appended(self, sheet_name: str, rows: List[List[Any]]) -> None:
+        """Drop stale record caches and extend cached columns with appended rows."""
+        self._record_cache.pop((self.spreadsheet.id, sheet_name), None)
+        for (cached_sheet, _), (_, index, values) in self._column_cache.items():
+            if cached_sheet == sheet_name:
+                values.extend(str(row[index]) if index < len(row) else "" for row in rows)
 
     def append_row(self, sheet_name: str, row: List[Any]) -> None:
         """
@@ -130,14 +302,104 @@ class GoogleSheetsClient:
         """
         worksheet = self.get_sheet(sheet_name)
         worksheet.append_row(row, value_input_option="USER_ENTERED")
+        self._record_appended(sheet_name, [list(row)])
+
+    def queue_append(self, sheet_name: str, row: List[Any]) -> None:
+        """
+        Buffer a row to be appended to a worksheet on the next `flush`.
+
+        Args:
+            sheet_name: Name of the worksheet to write to.
+            row: Sequence of values to append as a new row.
+
+        Returns:
+            None. Nothing is sent until `flush` runs; rows still queued at
+            interpreter exit are flushed then.
+        """
+        self._pending.setdefault(sheet_name, []).append(list(row))
+        # The exit hook only exists while rows are queued, so clients that never
+        # buffer anything are not kept alive by atexit.
+        if not self._exit_hook:
+            atexit.register(self.flush)
+            self._exit_hook = True
+
+    def flush(self) -> None:
+        """
+        Write all buffered rows, one `append_rows` request per worksheet.
+
+        Returns:
+            None. Buffers for worksheets written successfully are cleared.
+
+        Raises:
+            RuntimeError: If a worksheet with pending rows cannot be located.
+        """
+        while self._pending:
+            sheet_name, rows = next(iter(self._pending.items()))
+            worksheet = self.get_sheet(sheet_name)
+            worksheet.append_rows(rows, value_input_option="USER_ENTERED")
+            del self._pending[sheet_name]
+            self._record_appended(sheet_name, rows)
+        if self._exit_hook:
+            atexit.unregister(self.flush)
+            self._exit_hook = False
+
+
+@lru_cache(maxsize=8)
+def _authorized_client(credentials_path: str) -> Any:
+    """
+    Parse service account credentials and authorize gspread once per file.
+
+    Every GoogleSheetsClient built from the same file shares the resulting
+    client, and with it the pooled HTTP session.
+    """
+    credentials = Credentials.from_service_account_file(credentials_path, scopes=DEFAULT_SCOPES)
+    client = gspread.authorize(credentials)
+    _tune_session(client)
+    return client
+
+
+def _tune_session(client: Any) -> None:
+    """
+    Mount a larger connection pool with read retries on gspread's HTTP session.
+
+    gspread 6 keeps the session on `client.http_client`; older releases expose
+    it as `client.session`. requests already asks for gzip responses.
+    """
+    http_client = getattr(client, "http_client", client)
+    session = getattr(http_client, "session", None)
+    if session is None:
+        return
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=_RETRY))
+
+
+def _values_to_records(values: List[List[Any]], numericise: bool = True) -> List[Dict[str, Any]]:
+    """
+    Convert a raw value grid into row dictionaries the way `get_all_records` does.
+
+    The first row is the header; shorter rows are padded with "" and, when
+    `numericise` is set, numeric strings are converted to numbers.
+    """
+    if not values:
+        return []
+    header = values[0]
+    width = len(header)
+    records: List[Dict[str, Any]] = []
+    for row in values[1:]:
+        padded = (list(row) + [""] * width)[:width]
+        records.append(dict(zip(header, numericise_all(padded) if numericise else padded)))
+    return records
 
 
 # Backward-compatible placeholders for higher-level workflow stubs.
-def get_sheet_client(spreadsheet_name: str) -> GoogleSheetsClient:
+@lru_cache(maxsize=8)
+def get_sheet_client(spreadsheet_name: str, spreadsheet_id: str | None = None) -> GoogleSheetsClient:
     """
-    Convenience wrapper to instantiate a GoogleSheetsClient.
+    Convenience wrapper returning a shared GoogleSheetsClient per spreadsheet.
+
+    Repeated calls with the same name/ID reuse one client, skipping the
+    spreadsheet open and keeping its worksheet and record caches warm.
     """
-    return GoogleSheetsClient(spreadsheet_name=spreadsheet_name)
+    return GoogleSheetsClient(spreadsheet_name=spreadsheet_name, spreadsheet_id=spreadsheet_id)
 
 
 def read_profiles(sheet_client: GoogleSheetsClient, sheet_name: str) -> List[Dict[str, Any]]:
@@ -1,3 +1,4 @@
 """
-Utility helpers for logging, rate limiting, and ID tracking.
+Utility helpers for logging, rate limiting, ID tracking, LLM response caching,
+and shared HTTP sessions/JSON encoding.
 """
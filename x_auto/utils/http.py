@@ -0,0 +1,102 @@
+"""
+Shared HTTP helpers: pooled sessions, a POST-safe retry policy, and JSON encoding.
+
+orjson is used when installed (it is listed in requirements.txt) and stdlib
+json otherwise, so callers never need to check for it themselves.
+"""
+
+import json
+from typing import Any, Dict, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json is the fallback.
+    orjson = None
+
+
+class PostSafeRetry(Retry):
+    """
+    urllib3 retry policy that never re-sends a POST the server may have acted on.
+
+    GETs are retried on every status in `status_forcelist`. POSTs are retried
+    only on 429, which APIs return before doing any work: a 5xx or read timeout
+    after a POST may already have started a billed job. Connection errors are
+    retried for every method, since the request never reached the server.
+    Leave POST out of `allowed_methods` so read errors on it are not retried.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return status_code == 429 and bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON from raw response bytes (or text).
+
+    Args:
+        data: Body to decode, typically `response.content`.
+
+    Returns:
+        The decoded JSON value.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(payload: Any) -> bytes:
+    """
+    Encode a value to UTF-8 JSON bytes.
+
+    Args:
+        payload: JSON-serializable value.
+
+    Returns:
+        The encoded bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def json_body(payload: Any) -> Dict[str, Any]:
+    """
+    Build requests keyword arguments that send `payload` as a JSON body.
+
+    Args:
+        payload: JSON-serializable request body.
+
+    Returns:
+        `data` and `headers` keyword arguments for a requests call.
+    """
+    return {"data": json_dumps(payload), "headers": {"Content-Type": "application/json"}}
+
+
+def pooled_session(
+    pool_connections: int = 4,
+    pool_maxsize: int = 16,
+    retry: Optional[Retry] = None,
+) -> requests.Session:
+    """
+    Create a keep-alive session with a sized connection pool for HTTPS calls.
+
+    Args:
+        pool_connections: Number of host pools to keep.
+        pool_maxsize: Connections kept per host; match it to the caller's concurrency.
+        retry: urllib3 retry policy for the adapter. Defaults to no retries.
+
+    Returns:
+        A requests.Session with the adapter mounted for https://.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry or 0),
+    )
+    return session
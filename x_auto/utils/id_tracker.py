@@ -1,13 +1,52 @@
 """
 Helpers for tracking last-seen post IDs per profile to avoid duplicate replies.
+
+IDs are kept in memory and persisted to a small JSON file (LAST_SEEN_PATH, by
+default ~/.cache/x_auto/last_seen.json) so they survive restarts. X post IDs are
+Snowflakes, so they are stored as integers and compared numerically.
 """
 
-from typing import Dict
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+_LAST_SEEN_CACHE: Dict[str, int] = {}
+_LOADED = False
+
+
+def _store_path() -> Path:
+    """Return the JSON file backing the last-seen cache."""
+    default = Path.home() / ".cache" / "x_auto" / "last_seen.json"
+    return Path(os.getenv("LAST_SEEN_PATH") or default)
+
 
-_LAST_SEEN_CACHE: Dict[str, str] = {}
+def _ensure_loaded() -> None:
+    """Populate the in-memory cache from disk on first access."""
+    global _LOADED
+    if _LOADED:
+        return
+    _LOADED = True
+    try:
+        with _store_path().open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return
+    if isinstance(data, dict):
+        _LAST_SEEN_CACHE.update({str(k): int(v) for k, v in data.items() if str(v).isdigit()})
 
 
-def get_last_seen_id(handle: str) -> str:
+def _persist() -> None:
+    """Write the cache to disk, swapping the file in atomically."""
+    path = _store_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
+        json.dump(_LAST_SEEN_CACHE, handle)
+    os.replace(tmp_path, path)
+
+
+def get_last_seen_id(handle: str) -> int:
     """
     Retrieve the last processed post ID for a given handle.
 
@@ -15,20 +54,51 @@ def get_last_seen_id(handle: str) -> str:
         handle: X profile handle identifier.
 
     Returns:
-        The last seen post ID string, or an empty string if none is stored.
+        The last seen post ID, or 0 if none is stored.
+    """
+    _ensure_loaded()
+    return _LAST_SEEN_CACHE.get(handle, 0)
+
+
+def is_newer_than_last_seen(handle: str, post_id: Optional[Union[str, int]]) -> bool:
+    """
+    Check whether a post is newer than the last one processed for a handle.
+
+    Comparing Snowflake IDs numerically orders them by creation time without
+    any Sheets lookup.
+
+    Args:
+        handle: X profile handle identifier.
+        post_id: ID of the post to check.
+
+    Returns:
+        True when no ID is stored for the handle or the post's ID is larger;
+        False for older posts or IDs that are not numeric.
     """
-    return _LAST_SEEN_CACHE.get(handle, "")
+    candidate = str(post_id or "")
+    if not candidate.isdigit():
+        return False
+    return int(candidate) > get_last_seen_id(handle)
 
 
-def update_last_seen_id(handle: str, post_id: str) -> None:
+def update_last_seen_id(handle: str, post_id: Union[str, int]) -> None:
     """
     Update the stored last seen post ID for a given handle.
 
+    The stored value only moves forward; older or non-numeric IDs are ignored.
+
     Args:
         handle: X profile handle identifier.
         post_id: The newest processed post ID.
 
     Returns:
-        None. Updates the in-memory cache; callers may persist separately.
+        None. Updates the in-memory cache and writes it through to disk.
     """
-    _LAST_SEEN_CACHE[handle] = post_id
+    candidate = str(post_id)
+    if not candidate.isdigit():
+        return
+    value = int(candidate)
+    if value <= get_last_seen_id(handle):
+        return
+    _LAST_SEEN_CACHE[handle] = value
+    _persist()
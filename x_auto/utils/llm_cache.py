@@ -0,0 +1,111 @@
+"""
+Disk-backed cache for LLM responses, keyed by a hash of the full request.
+
+Entries live in a small SQLite file (LLM_CACHE_PATH, default
+data/llm_cache.sqlite) and expire after LLM_CACHE_TTL seconds (default 24h;
+0 disables the cache).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class LLMCache:
+    """
+    Thread-safe SQLite store mapping request hashes to response text.
+
+    Example usage:
+        cache = LLMCache("data/llm_cache.sqlite", ttl_seconds=86400)
+        key = LLMCache.make_key({"model": "gpt-4o-mini", "prompt": p, "content": c})
+        reply = cache.get(key)
+        if reply is None:
+            reply = call_api()
+            cache.set(key, reply)
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = 86400):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """Return a SHA-256 hex digest of the request, independent of key order."""
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use and make sure the table exists."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, response TEXT, ts INTEGER)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Digest from `make_key`.
+
+        Returns:
+            The cached response, or None when missing, expired, or caching is off.
+        """
+        if self.ttl_seconds <= 0:
+            return None
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT response, ts FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] >= self.ttl_seconds:
+            return None
+        return row[0]
+
+    def set(self, key: str, response: str) -> None:
+        """
+        Store a response, replacing any previous entry for the key.
+
+        Args:
+            key: Digest from `make_key`.
+            response: Response text to cache.
+
+        Returns:
+            None.
+        """
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, ts) VALUES (?, ?, ?)",
+                (key, response, int(time.time())),
+            )
+            conn.commit()
+
+
+_DEFAULT_CACHE: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """
+    Return the process-wide cache configured from LLM_CACHE_PATH / LLM_CACHE_TTL.
+
+    Returns:
+        A shared LLMCache instance.
+    """
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = LLMCache(
+            os.getenv("LLM_CACHE_PATH") or os.path.join("data", "llm_cache.sqlite"),
+            ttl_seconds=int(os.getenv("LLM_CACHE_TTL", "86400") or 0),
+        )
+    return _DEFAULT_CACHE
@@ -2,14 +2,22 @@
 Logger factory for consistent application logging.
 """
 
+import functools
 import logging
+import os
 from typing import Any
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> Any:
     """
     Configure and return a logger instance.
 
+    The level comes from LOG_LEVEL (default INFO); pass %-style arguments so
+    messages below that level are never formatted. Each name is configured
+    once and cached; records do not propagate to ancestor loggers, so a root
+    handler does not print them a second time.
+
     Args:
         name: Logger name, typically __name__ from the caller.
 
@@ -22,5 +30,6 @@ def get_logger(name: str) -> Any:
         formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
         handler.setFormatter(formatter)
         logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+        logger.propagate = False
+    logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
     return logger
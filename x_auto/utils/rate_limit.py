@@ -2,24 +2,105 @@
 Simple rate-limiting helpers to prevent API overuse.
 """
 
+import functools
+import threading
 import time
-from typing import Callable
+from typing import Callable, Optional
 
 
-def throttle(delay_seconds: float) -> Callable:
+class TokenBucket:
     """
-    Decorator-style throttle to pause between function executions.
+    Thread-safe token bucket: bursts up to `capacity` calls, refilled at `rate` per second.
+
+    Callers only sleep when the bucket is empty, so idle periods build up
+    budget instead of every call paying a fixed delay.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        # At least one whole token, or `acquire` would cap every call's cost
+        # below 1 and rates under 1/s would run faster than asked.
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """
+        Take `amount` tokens, sleeping until they are available.
+
+        Args:
+            amount: Tokens to take; requests above `capacity` are capped at it.
+
+        Returns:
+            None.
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = (amount - self._tokens) / self.rate if self._tokens < amount else 0.0
+            # Spend the tokens now (possibly going negative) so concurrent callers
+            # queue behind this one instead of all waking at once.
+            self._tokens -= amount
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """
+    Combined requests-per-minute and tokens-per-minute limiter for LLM APIs.
+
+    Either limit may be 0 to disable it. Each call takes one request slot and
+    an estimated token count, sleeping until both budgets allow it.
+    """
+
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0):
+        self._requests: Optional[TokenBucket] = None
+        self._tokens: Optional[TokenBucket] = None
+        if requests_per_minute > 0:
+            self._requests = TokenBucket(requests_per_minute / 60, requests_per_minute)
+        if tokens_per_minute > 0:
+            self._tokens = TokenBucket(tokens_per_minute / 60, tokens_per_minute)
+
+    def acquire(self, estimated_tokens: int = 0) -> None:
+        """
+        Wait until one more request of `estimated_tokens` fits within both limits.
+
+        Args:
+            estimated_tokens: Prompt plus completion tokens the call may use.
+
+        Returns:
+            None.
+        """
+        if self._requests is not None:
+            self._requests.acquire()
+        if self._tokens is not None and estimated_tokens > 0:
+            self._tokens.acquire(estimated_tokens)
+
+
+def throttle(rate_per_sec: float, capacity: Optional[float] = None) -> Callable:
+    """
+    Decorator that limits calls to the wrapped function with a token bucket.
 
     Args:
-        delay_seconds: Seconds to sleep before calling the wrapped function.
+        rate_per_sec: Sustained number of calls allowed per second.
+        capacity: Largest burst allowed after an idle period. Defaults to
+            `max(1, rate_per_sec)`, so rates below one call per second still
+            admit whole calls instead of capping each call's cost.
 
     Returns:
-        A wrapper function that enforces the delay.
+        A decorator whose wrapped functions share one bucket.
     """
+    bucket = TokenBucket(rate_per_sec, capacity)
 
     def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
         def wrapped(*args, **kwargs):
-            time.sleep(delay_seconds)
+            bucket.acquire()
             return func(*args, **kwargs)
 
         return wrapped
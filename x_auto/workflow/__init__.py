@@ -2,4 +2,14 @@
 Workflow orchestration for the end-to-end automation.
 """
 
-from x_auto.workflow.pipeline import run_pipeline  # noqa: F401
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    # Import the pipeline (and its Sheets/X/Apify dependencies) only when it is
+    # asked for, so `x_auto.workflow.scrape_filter` can be imported on its own.
+    if name == "run_pipeline":
+        from x_auto.workflow.pipeline import run_pipeline
+
+        return run_pipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,20 +4,45 @@ High-level automation pipeline:
 → (5) send to X → (6) log results.
 
 This module wires together the major components while leaving detailed
-utilities (ID tracking, logging formatting, human approval) as stubs.
+utilities (logging formatting, human approval) as stubs.
 """
 
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AbstractSet, Any, Dict, FrozenSet, List, Optional, Tuple
 
-from scrapers.apify_client import fetch_posts
+from scrapers.apify_client import fetch_posts_by_urls
 
-from x_auto.matcher.keyword_matcher import match_keywords, score_matches
+from x_auto.matcher.keyword_matcher import match_keywords, prepare_keyword_rows, score_matches
 from x_auto.reply_engine.reply_generator import build_reply_text, select_best_template
 from x_auto.sheets.client import GoogleSheetsClient
-from x_auto.x_api.x_client import post_reply
+from x_auto.utils.id_tracker import is_newer_than_last_seen, update_last_seen_id
+from x_auto.utils.logger import get_logger
+from x_auto.x_api.x_client import post_replies
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """Environment-derived settings for `run_pipeline`, read once per process."""
+
+    spreadsheet_name: str
+    enable_posting: bool
+    reply_concurrency: int
+
+
+@lru_cache(maxsize=1)
+def _config() -> PipelineConfig:
+    """Load the pipeline settings from the environment on first use."""
+    return PipelineConfig(
+        spreadsheet_name=os.getenv("GOOGLE_SPREADSHEET_NAME", "Automation Config"),
+        enable_posting=os.getenv("ENABLE_X_POSTING", "false").lower() == "true",
+        reply_concurrency=max(1, int(os.getenv("X_REPLY_CONCURRENCY", "4") or 4)),
+    )
 
 
 def run_pipeline() -> None:
@@ -26,68 +51,156 @@ def run_pipeline() -> None:
 
     Steps:
         1) Load profile handles and keyword/template rows from Google Sheets.
-        2) Fetch recent posts for each handle via Apify.
-        3) Filter out posts that have already been processed (placeholder utility).
+        2) Fetch recent posts for every handle via Apify, concurrently.
+        3) Filter out posts that have already been processed (via the logs sheet).
         4) Perform keyword matching and compute scores.
         5) Choose the best template and generate a reply (delegated to reply_engine).
         6) Optionally request human approval (placeholder utility).
-        7) Post the reply to X.
-        8) Log the interaction back to Google Sheets.
+        7) Post the collected replies to X, several at a time.
+        8) Log the interaction back to Google Sheets (buffered, written once at the end).
 
     Note:
         This function focuses on orchestration; several utilities are intentionally
         left as stubs for future implementation.
     """
-    spreadsheet_name = os.getenv("GOOGLE_SPREADSHEET_NAME", "Automation Config")
-    sheet_client = GoogleSheetsClient(spreadsheet_name=spreadsheet_name)
-    enable_posting = os.getenv("ENABLE_X_POSTING", "false").lower() == "true"
+    config = _config()
+    sheet_client = GoogleSheetsClient(spreadsheet_name=config.spreadsheet_name)
+
+    sheets = sheet_client.read_many_records(["profiles", "keywords", "templates"])
+    profile_rows = sheets["profiles"]
+    # Keywords are normalized once here instead of for every post.
+    keyword_rows = prepare_keyword_rows(sheets["keywords"])
+    template_rows = sheets["templates"]
+    existing_ids = set(get_processed_ids(sheet_client, "logs"))
+
+    profile_urls = [
+        profile.get("profile_url") or profile.get("x_profile_url") or "" for profile in profile_rows
+    ]
+    # Actor runs are network-bound, so all profiles are fetched concurrently up front.
+    posts_by_url = fetch_posts_by_urls([url for url in profile_urls if url], results_limit=20)
+
+    try:
+        to_post: List[Tuple[str, Dict[str, Any], str]] = []
+        for profile_url, raw_posts in posts_by_url.items():
+            new_posts = filter_already_processed(raw_posts, existing_ids, last_seen_key=profile_url)
+
+            for post in new_posts:
+                text = post.get("text", "")
+                matches = match_keywords(text, keyword_rows)
+                score = score_matches(matches, post_metadata=post)
+
+                template = select_best_template(matches, template_rows)
+                reply_text = build_reply_text(template, post, matches)
+
+                if requires_human_approval(post, reply_text):
+                    # Placeholder: route to human review (Slack/Telegram/Sheets).
+                    continue
+
+                if not config.enable_posting:
+                    # Skip posting when disabled.
+                    continue
+
+                to_post.append((profile_url, post, reply_text))
+                # Claimed now so the same post seen under another profile is not queued twice.
+                existing_ids.add(_post_id(post))
+
+        # Replies are sent concurrently; the shared reply rate limit in x_client
+        # still paces them.
+        responses = post_replies(
+            [(reply_text, post.get("id", "")) for _, post, reply_text in to_post],
+            max_workers=config.reply_concurrency,
+        )
+        replied: Dict[str, List[str]] = {}
+        failed: Dict[str, List[str]] = {}
+        for (profile_url, post, reply_text), response in zip(to_post, responses):
+            if "error" in response:
+                # Not logged, so the post is picked up again on the next run.
+                logger.warning("Reply to %s failed: %s", _post_id(post), response["error"])
+                failed.setdefault(profile_url, []).append(_post_id(post))
+                continue
+            log_row = format_log_row(post, reply_text, response)
+            sheet_client.queue_append("logs", log_row)
+            replied.setdefault(profile_url, []).append(_post_id(post))
+        for profile_url, post_ids in replied.items():
+            _advance_last_seen(profile_url, post_ids, failed.get(profile_url, []))
+    finally:
+        sheet_client.flush()
 
-    profile_rows = sheet_client.read_records("profiles")
-    keyword_rows = sheet_client.read_records("keywords")
-    template_rows = sheet_client.read_records("templates")
 
-    for profile in profile_rows:
-        profile_url = profile.get("profile_url") or profile.get("x_profile_url") or ""
-        if not profile_url:
-            continue
+# Placeholder utilities with docstrings for future implementation ----------------
 
-        raw_posts = fetch_posts([profile_url], results_limit=20)
-        new_posts = filter_already_processed(raw_posts)
+def _post_id(post: Dict[str, Any]) -> str:
+    """Return a post's ID as a string, accepting either Apify ID field."""
+    return str(post.get("id") or post.get("postId") or "")
 
-        for post in new_posts:
-            text = post.get("text", "")
-            matches = match_keywords(text, keyword_rows)
-            score = score_matches(matches, post_metadata=post)
 
-            template = select_best_template(matches, template_rows)
-            reply_text = build_reply_text(template, post, matches)
+def filter_already_processed(
+    posts: List[Dict[str, Any]],
+    existing_ids: AbstractSet[str],
+    last_seen_key: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Skip posts whose IDs are already known to have been handled.
 
-            if requires_human_approval(post, reply_text):
-                # Placeholder: route to human review (Slack/Telegram/Sheets).
-                continue
+    Callers load the IDs once per run (see `get_processed_ids`) and pass the
+    same set for every profile, adding IDs as replies are posted. When
+    `last_seen_key` is given, numeric (Snowflake) IDs at or below the last-seen
+    ID stored for that key are skipped as well; non-numeric IDs fall back to the
+    set check alone.
 
-            if not enable_posting:
-                # Skip posting when disabled.
-                continue
+    Args:
+        posts: Raw posts returned by Apify.
+        existing_ids: Post IDs already present in the interaction log.
+        last_seen_key: Profile key in `x_auto.utils.id_tracker`, or None to skip
+            the last-seen comparison.
 
-            response = post_reply(text=reply_text, in_reply_to_post_id=post.get("id", ""))
-            log_row = format_log_row(post, reply_text, response)
-            sheet_client.append_row("logs", log_row)
+    Returns:
+        A filtered list containing only new/unprocessed posts.
+    """
+    new_posts = []
+    for post in posts:
+        post_id = _post_id(post)
+        if post_id in existing_ids:
+            continue
+        if last_seen_key and post_id.isdigit() and not is_newer_than_last_seen(last_seen_key, post_id):
+            continue
+        new_posts.append(post)
+    return new_posts
 
 
-# Placeholder utilities with docstrings for future implementation ----------------
+def _advance_last_seen(last_seen_key: str, replied_ids: List[str], failed_ids: List[str]) -> None:
+    """
+    Move a profile's last-seen ID up to its newest successful reply.
+
+    The ID never passes a failed reply, so the failed post is still newer than
+    the stored ID and gets retried on the next run.
 
-def filter_already_processed(posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    Args:
+        last_seen_key: Profile key in `x_auto.utils.id_tracker`.
+        replied_ids: IDs of posts replied to in this run.
+        failed_ids: IDs of posts whose reply failed in this run.
+    """
+    ceiling = min((int(i) for i in failed_ids if i.isdigit()), default=None)
+    candidates = [int(i) for i in replied_ids if i.isdigit() and (ceiling is None or int(i) < ceiling)]
+    if candidates:
+        update_last_seen_id(last_seen_key, max(candidates))
+
+
+def get_processed_ids(sheet_client: GoogleSheetsClient, sheet_name: str = "logs") -> FrozenSet[str]:
     """
-    Placeholder for ID tracking to skip posts that were already handled.
+    Load the set of already-handled post IDs from a log worksheet.
+
+    Only the header row and the "post_id" column are fetched, rather than the
+    whole grid as row dictionaries.
 
     Args:
-        posts: Raw posts returned by Apify.
+        sheet_client: Authenticated GoogleSheetsClient holding the log sheet.
+        sheet_name: Worksheet with a "post_id" header column.
 
     Returns:
-        A filtered list containing only new/unprocessed posts.
+        Frozenset of non-empty post IDs; empty when the column does not exist.
     """
-    raise NotImplementedError("Implement ID tracking to filter already processed posts.")
+    return frozenset(value for value in sheet_client.read_column(sheet_name, "post_id") if value)
 
 
 def format_log_row(post: Dict[str, Any], reply_text: str, response: Dict[str, Any]) -> List[Any]:
@@ -17,18 +17,114 @@ from __future__ import annotations
 
 import os
 import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import groupby
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from x_auto.reply_engine.template_builder import weighted_length
+from x_auto.utils.http import PostSafeRetry, json_dumps, json_loads, pooled_session
+from x_auto.utils.llm_cache import LLMCache, get_llm_cache
+from x_auto.utils.rate_limit import RateLimiter
+
+# dotenv, gspread/google-auth, and the Apify client are imported where they are
+# used, so importing this module for its helpers stays cheap.
+if TYPE_CHECKING:
+    from x_auto.sheets.client import GoogleSheetsClient
+
+OPENAI_API_BASE = "https://api.openai.com/v1"
+
+# One keep-alive session for every OpenAI call, so concurrent LLM requests reuse
+# pooled TLS connections. Retries back off exponentially and wait out
+# Retry-After; POSTs (completions, file uploads, batch creation) are retried only
+# on 429, since a 5xx may come back after the work was already done and billed.
+_OPENAI_SESSION = pooled_session(
+    pool_connections=4,
+    pool_maxsize=32,
+    retry=PostSafeRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    ),
+)
+
+
+@lru_cache(maxsize=1)
+def _openai_limiter() -> RateLimiter:
+    """
+    Client-side budget shared by all concurrent OpenAI calls, so bursts queue
+    locally instead of failing with 429s. Built on first use, after load_env,
+    from OPENAI_RPM_LIMIT / OPENAI_TPM_LIMIT (0 disables a limit).
+    """
+    return RateLimiter(
+        requests_per_minute=float(os.getenv("OPENAI_RPM_LIMIT", "0") or 0),
+        tokens_per_minute=float(os.getenv("OPENAI_TPM_LIMIT", "0") or 0),
+    )
+
+
+# Terminal states of an OpenAI batch job.
+_BATCH_DONE_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# One "i: yes|no - reason" line per post in a batched LLM decision; the "POST i"
+# label used in the request is accepted too, since models often echo it.
+_BATCH_DECISION_RE = re.compile(r"^\s*(?:POST[ \t]*)?(\d+)[ \t]*[:.)][ \t]*(yes|no)\b[ \t]*[-:]?[ \t]*(.*)$", re.IGNORECASE | re.MULTILINE)
+
+# Separators between several links in one cell (whitespace, commas, pipes, newlines).
+_SPLIT_LINKS_RE = re.compile(r"[\s,|]+")
+# Placeholder cell values that mean "no link".
+_SKIP_LINK_VALUES = frozenset({"n/a", "na", "(full link not provided)"})
+# Leading scheme/host of an X or Twitter profile link, normalized to https://x.com/.
+_X_HOST_RE = re.compile(r"^(?:https?://)?(?:www\.|mobile\.)?(?:twitter|x)\.com/", re.IGNORECASE)
+
+# Texts made only of punctuation, symbols, emoji, or whitespace.
+_NO_WORDS_RE = re.compile(r"[\W_]+")
+
+# Texts made only of links (e.g. a bare shared t.co URL).
+_URLS_ONLY_RE = re.compile(r"(?:https?://\S+\s*)+")
 
-import requests
-from dotenv import load_dotenv
+# Apify fields whose presence marks a post as a reply.
+_REPLY_KEYS = ("inReplyToStatusId", "inReplyToPostId", "inReplyTo", "parentPostId")
 
-from scrapers.apify_client import fetch_posts
-from x_auto.sheets.client import GoogleSheetsClient
+# Header names accepted for the handle/link columns, in order of preference.
+_HANDLE_HEADERS = ("X(handle)", "X handle", "handle")
+_LINK_HEADERS = ("X(link)", "X link", "link")
+
+# (spreadsheet id, worksheet) -> (sheet has any content, (profile_url, text, timestamp)
+# keys already written), so repeated writes in one process skip re-reading the sheet.
+_OUTPUT_DEDUP_CACHE: Dict[Tuple[str, str], Tuple[bool, set]] = {}
+
+# Fallback prompts used when the prompts sheet has no match_prompt / reply_prompt.
+DEFAULT_MATCH_PROMPT = (
+    'You are a professional liquid fund investor, please see if this content has the similar information as the '
+    '"content provided" or is related to an industry, token analysis that would help investment. '
+    'Respond with "yes" or "no".'
+)
+DEFAULT_REPLY_PROMPT = (
+    "You craft concise, human replies for a professional liquid fund account. "
+    "Read the user's post and propose a short, friendly reply that adds value, "
+    "acknowledges the topic, and avoids hype. Use relevant domain knowledge if helpful. "
+    "Keep it under 100 words (aim for brevity). "
+    "Do not include placeholders or ask for more info. Return only the reply text."
+)
+
+# Appended to the decision prompt for batched decisions. It does not vary with
+# the batch, so every request shares one system message (and OpenAI's prefix cache).
+_BATCH_DECISION_INSTRUCTIONS = (
+    "You will receive numbered posts. For each POST i, output "
+    "'i: yes - reason' or 'i: no - reason' on its own line, and nothing else."
+)
+
+OUTPUT_HEADERS = ["profile_url", "post_content", "timestamp_ms", "reply_recommendation", "post_link"]
 
 
 def load_env() -> None:
     """Load environment variables from .env if present."""
+    from dotenv import load_dotenv
+
     if os.path.isfile(".env"):
         load_dotenv(".env")
     elif os.path.isfile(".env.example"):
@@ -63,80 +159,77 @@ def get_profile_urls(sheet_client: GoogleSheetsClient, sheet_name: str = "profil
         else:
             raise RuntimeError(f"Worksheet '{worksheet_name}' not found.") from last_exc
 
-    urls: List[str] = []
-    def normalize_links(raw: str) -> List[str]:
-        cleaned: List[str] = []
-        # Split on common separators (whitespace, commas, pipes, newlines)
-        parts = re.split("[\\s,|]+", raw)
-        for part in parts:
+    def normalize_links(raw: str) -> Iterator[str]:
+        for part in _SPLIT_LINKS_RE.split(raw):
             p = part.replace("\u00a0", " ").strip().strip('"').strip("'")
-            if not p or p.lower() in {"n/a", "na", "(full link not provided)"}:
+            if not p or p.lower() in _SKIP_LINK_VALUES:
                 continue
-            # Normalize twitter.com → x.com
-            p = p.replace("twitter.com", "x.com")
-            # Add protocol if missing
-            if p.startswith("x.com/") or p.startswith("www.x.com/"):
-                p = "https://" + p
+            # One substitution normalizes twitter.com/www./mobile. and a missing scheme.
+            p = _X_HOST_RE.sub("https://x.com/", p, count=1)
             if not p.startswith("http"):
                 continue
-            cleaned.append(p)
-        return cleaned
+            yield p
 
     def is_valid(url: str) -> bool:
-        cleaned = url.replace("\u00a0", " ").strip()
-        if "x.com/" not in cleaned:
-            return False
-        if cleaned.startswith("http://"):
-            cleaned = "https://" + cleaned[len("http://") :]
-        # Accept any https URL containing x.com with no spaces.
-        return cleaned.startswith("https://") and ("x.com/" in cleaned) and (" " not in cleaned)
-
-    try:
-        records = worksheet.get_all_records()
-        for row in records:
-            handle = row.get("X(handle)") or row.get("X handle") or row.get("handle")
-            link = row.get("X(link)") or row.get("X link") or row.get("link")
-            handle = (handle or "").strip().lstrip("@")
-            link = (link or "").strip()
-
-            if link:
-                urls.extend(normalize_links(link))
-            if handle:
-                urls.append(f"https://x.com/{handle}")
-    except Exception:
-        records = None
-
-    # Fallback if headers are not unique or URLs are empty: use 5th column (index 4).
-    if not urls:
-        values = worksheet.get_all_values()
-        if values:
-            for row in values[1:]:
-                if len(row) > 4 and row[4].strip():
-                    urls.extend(normalize_links(row[4].strip()))
+        # Links are already cleaned and put on https://x.com/ by normalize_links,
+        # so this is a pure check: an https URL containing x.com/ with no spaces.
+        return url.startswith("https://") and "x.com/" in url and " " not in url and "\u00a0" not in url
 
-    # Deduplicate and validate.
+    # URLs are validated and deduplicated as they are produced, in one pass.
     seen = set()
     valid_urls: List[str] = []
-    for u in urls:
-        if not is_valid(u):
-            continue
-        if u in seen:
-            continue
-        seen.add(u)
-        valid_urls.append(u)
+    candidates = 0
+
+    def collect(url: str) -> None:
+        nonlocal candidates
+        candidates += 1
+        if url not in seen and is_valid(url):
+            seen.add(url)
+            valid_urls.append(url)
 
-    if len(valid_urls) != len(urls):
-        print(f"Filtered out {len(urls) - len(valid_urls)} invalid profile URLs.")
+    # One bulk read of raw cell values; columns are located by header position
+    # instead of building a dict per row.
+    values = worksheet.get_all_values()
+    header = values[0] if values else []
+    rows = values[1:]
+    handle_idx = next((header.index(h) for h in _HANDLE_HEADERS if h in header), None)
+    link_idx = next((header.index(h) for h in _LINK_HEADERS if h in header), None)
+    for row in rows:
+        link = row[link_idx].strip() if link_idx is not None and link_idx < len(row) else ""
+        handle = row[handle_idx].strip().lstrip("@") if handle_idx is not None and handle_idx < len(row) else ""
+
+        if link:
+            for url in normalize_links(link):
+                collect(url)
+        if handle:
+            collect(f"https://x.com/{handle}")
+
+    # Fallback if headers are missing or URLs are empty: use 5th column (index 4).
+    if not candidates:
+        for row in rows:
+            if len(row) > 4 and row[4].strip():
+                for url in normalize_links(row[4].strip()):
+                    collect(url)
+
+    if len(valid_urls) != candidates:
+        print(f"Filtered out {candidates - len(valid_urls)} invalid profile URLs.")
     return valid_urls
 
 
-def is_recent_post(post: Dict[str, Any], days: int = 30) -> bool:
+def recent_cutoff_ms(days: int) -> int:
+    """Return the epoch-millisecond instant `days` days before now (UTC)."""
+    return int((datetime.now(tz=timezone.utc) - timedelta(days=days)).timestamp() * 1000)
+
+
+def is_recent_post(post: Dict[str, Any], days: int = 30, cutoff_ms: Optional[int] = None) -> bool:
     """
     Check whether a post's timestamp falls within the last N days.
 
     Args:
         post: Post dictionary (expects a 'timestamp' field in milliseconds).
         days: Window size in days to treat as recent.
+        cutoff_ms: Precomputed cutoff from `recent_cutoff_ms`; callers checking
+            many posts pass it so "now" is computed once. Overrides `days`.
 
     Returns:
         True if timestamp is within the window; False otherwise.
@@ -145,11 +238,12 @@ def is_recent_post(post: Dict[str, Any], days: int = 30) -> bool:
     if ts is None:
         return False
     try:
-        ts_dt = datetime.fromtimestamp(int(ts) / 1000, tz=timezone.utc)
-    except Exception:
+        ts_ms = int(ts)
+    except (TypeError, ValueError):
         return False
-    cutoff = datetime.now(tz=timezone.utc) - timedelta(days=days)
-    return ts_dt >= cutoff
+    if cutoff_ms is None:
+        cutoff_ms = recent_cutoff_ms(days)
+    return ts_ms >= cutoff_ms
 
 
 def merge_threaded_posts(posts: List[Dict[str, Any]], window_ms: int = 120_000) -> List[Dict[str, Any]]:
@@ -163,40 +257,66 @@ def merge_threaded_posts(posts: List[Dict[str, Any]], window_ms: int = 120_000)
 
     Returns:
         A list of merged post dictionaries.
+
+    Example:
+        >>> merged = merge_threaded_posts([
+        ...     {"id": "1", "conversationId": "c", "timestamp": 0, "text": "a"},
+        ...     {"id": "2", "conversationId": "c", "timestamp": 1, "text": "b", "postUrl": "u2"},
+        ... ])
+        >>> merged[0]["text"], merged[0]["postId"], merged[0]["postUrl"]
+        ('a b', '1,2', 'u2')
     """
-    # Group by conversation id (fallback to post id if missing).
-    groups: Dict[str, List[Dict[str, Any]]] = {}
+    # Group by conversation id (fallback to post id if missing). Groups keep the
+    # order in which their first post appears, so one sort by (group rank,
+    # timestamp) lays every group out contiguously, timestamp-less posts last.
+    group_rank: Dict[str, int] = {}
+    keyed: List[Tuple[int, bool, Any, Dict[str, Any]]] = []
     for p in posts:
         cid = str(p.get("conversationId") or p.get("postId") or p.get("id") or "")
-        groups.setdefault(cid, []).append(p)
+        rank = group_rank.setdefault(cid, len(group_rank))
+        ts = p.get("timestamp")
+        keyed.append((rank, ts is None, 0 if ts is None else ts, p))
+    keyed.sort(key=lambda item: item[:3])
 
     merged_all: List[Dict[str, Any]] = []
-    for group in groups.values():
-        posts_with_ts = [p for p in group if p.get("timestamp") is not None]
-        posts_no_ts = [p for p in group if p.get("timestamp") is None]
-
+    for _, group in groupby(keyed, key=lambda item: item[0]):
         merged: List[Dict[str, Any]] = []
-        for p in sorted(posts_with_ts, key=lambda x: x["timestamp"]):
-            if not merged:
+        posts_no_ts: List[Dict[str, Any]] = []
+        # Insertion-ordered sets of the IDs/URLs folded into each merged post,
+        # joined once at the end instead of re-scanning growing strings.
+        merged_ids: List[Dict[str, None]] = []
+        merged_urls: List[Dict[str, None]] = []
+        for _, no_ts, _, p in group:
+            if no_ts:
+                posts_no_ts.append(p)
+                continue
+            pid = str(p.get("postId") or p.get("id") or "")
+            purl = str(p.get("postUrl") or p.get("url") or "")
+            if not merged or p["timestamp"] - merged[-1]["timestamp"] > window_ms:
                 merged.append(p)
+                merged_ids.append(dict.fromkeys([pid] if pid else []))
+                merged_urls.append(dict.fromkeys([purl] if purl else []))
                 continue
+            # Merge content fields and track IDs/URLs.
             prev = merged[-1]
-            if p["timestamp"] - prev["timestamp"] <= window_ms:
-                # Merge content fields and track IDs/URLs.
-                prev_text = prev.get("text") or prev.get("postText") or ""
-                new_text = (p.get("text") or p.get("postText") or "")
-                prev["text"] = (prev_text + " " + new_text).strip()
-                # Concatenate IDs and post URLs to retain references.
-                pid = prev.get("postId") or prev.get("id") or ""
-                nid = p.get("postId") or p.get("id") or ""
-                if nid and nid not in pid:
-                    prev["postId"] = f"{pid},{nid}".strip(",")
-                purl = prev.get("postUrl") or prev.get("url") or ""
-                nurl = p.get("postUrl") or p.get("url") or ""
-                if nurl and nurl not in purl:
-                    prev["postUrl"] = f"{purl} {nurl}".strip()
-            else:
-                merged.append(p)
+            prev_text = prev.get("text") or prev.get("postText") or ""
+            new_text = (p.get("text") or p.get("postText") or "")
+            prev["text"] = (prev_text + " " + new_text).strip()
+            if pid:
+                merged_ids[-1][pid] = None
+            if purl:
+                merged_urls[-1][purl] = None
+
+        for post, ids, urls in zip(merged, merged_ids, merged_urls):
+            # Concatenate IDs and post URLs to retain references. Compare against the
+            # head post's own value so a lone ID/URL folded in from a later post is
+            # kept even when the head had none.
+            joined_ids = ",".join(ids)
+            if joined_ids and joined_ids != str(post.get("postId") or post.get("id") or ""):
+                post["postId"] = joined_ids
+            joined_urls = " ".join(urls)
+            if joined_urls and joined_urls != str(post.get("postUrl") or post.get("url") or ""):
+                post["postUrl"] = joined_urls
 
         merged.extend(posts_no_ts)
         merged_all.extend(merged)
@@ -204,6 +324,23 @@ def merge_threaded_posts(posts: List[Dict[str, Any]], window_ms: int = 120_000)
     return merged_all
 
 
+def _canonicalize_post(post: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fill a post's "text" field in place from whichever key Apify used.
+
+    The scraper may return the body as "text" or "postText"; resolving it once
+    per fetched post lets later stages read post["text"] directly.
+
+    Args:
+        post: Raw post dictionary from Apify.
+
+    Returns:
+        The same dictionary, with "text" always set to a string.
+    """
+    post["text"] = str(post.get("text") or post.get("postText") or "")
+    return post
+
+
 def is_reply(post: Dict[str, Any]) -> bool:
     """
     Determine if a post is a reply rather than a root/original post.
@@ -216,10 +353,7 @@ def is_reply(post: Dict[str, Any]) -> bool:
     conv_id = post.get("conversationId")
     if conv_id and post_id and str(conv_id) != str(post_id):
         return True
-    for key in ("inReplyToStatusId", "inReplyToPostId", "inReplyTo", "parentPostId"):
-        if post.get(key):
-            return True
-    return False
+    return any(post.get(key) for key in _REPLY_KEYS)
 
 
 def get_prompt(sheet_client: GoogleSheetsClient, sheet_name: str = "prompts") -> str:
@@ -240,12 +374,12 @@ def get_prompt(sheet_client: GoogleSheetsClient, sheet_name: str = "prompts") ->
     Raises:
         RuntimeError: If no prompt can be found.
     """
-    worksheet = sheet_client.get_sheet(sheet_name)
-    records = worksheet.get_all_records()
+    # Prompts are plain text, so the raw-string read skips gspread's type inference.
+    records = sheet_client.read_records_fast(sheet_name)
     if records and "prompt" in records[0] and records[0]["prompt"]:
         return str(records[0]["prompt"])
 
-    values = worksheet.get_all_values()
+    values = sheet_client.get_sheet(sheet_name).get_all_values()
     if values and values[0] and values[0][0]:
         return str(values[0][0])
 
@@ -261,6 +395,9 @@ def call_chatgpt(
     """
     Call the OpenAI Chat Completions API and return the model's content response.
 
+    Identical requests are answered from the on-disk LLM cache while fresh
+    (see `x_auto.utils.llm_cache`), so reruns skip the API entirely.
+
     Args:
         prompt: Instruction describing acceptance criteria.
         content: Post text to evaluate.
@@ -277,6 +414,14 @@ def call_chatgpt(
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY is required for ChatGPT calls.")
 
+    cache = get_llm_cache()
+    cache_key = LLMCache.make_key(
+        {"model": model, "prompt": prompt, "content": content, "max_tokens": max_tokens}
+    )
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     body = {
         "model": model,
         "messages": [
@@ -289,11 +434,15 @@ def call_chatgpt(
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
-    resp = requests.post("https://api.openai.com/v1/chat/completions", json=body, headers=headers, timeout=30)
+    # Rough token estimate: ~4 characters per token plus the completion budget.
+    _openai_limiter().acquire(estimated_tokens=max_tokens + (len(prompt) + len(content)) // 4)
+    resp = _OPENAI_SESSION.post(f"{OPENAI_API_BASE}/chat/completions", data=json_dumps(body), headers=headers, timeout=30)
     if not resp.ok:
         raise RuntimeError(f"ChatGPT API error {resp.status_code}: {resp.text}")
-    data = resp.json()
-    return data["choices"][0]["message"]["content"].strip()
+    data = json_loads(resp.content)
+    reply = data["choices"][0]["message"]["content"].strip()
+    cache.set(cache_key, reply)
+    return reply
 
 
 def is_match_via_llm(prompt: str, post_text: str) -> bool:
@@ -311,6 +460,153 @@ def is_match_via_llm(prompt: str, post_text: str) -> bool:
     return "yes" in reply.lower()
 
 
+def get_llm_decisions_batch(prompt: str, texts: List[str]) -> List[Dict[str, Any]]:
+    """
+    Ask the LLM for yes/no decisions on several posts in a single request.
+
+    Posts are numbered in one user message and the model is asked for one
+    "i: yes|no - reason" line each. Posts the reply does not cover are
+    decided individually via `is_match_via_llm`.
+
+    Args:
+        prompt: Decision prompt applied to every post.
+        texts: Post texts to evaluate.
+
+    Returns:
+        One {"match": bool, "reason": str} dict per text, in input order.
+    """
+    if not texts:
+        return []
+    system = f"{prompt}\n\n{_BATCH_DECISION_INSTRUCTIONS}"
+    content = "\n---\n".join(f"POST {i}:\n{text}" for i, text in enumerate(texts, start=1))
+    reply = call_chatgpt(system, content, max_tokens=40 * len(texts))
+
+    decisions: Dict[int, Dict[str, Any]] = {}
+    for number, verdict, reason in _BATCH_DECISION_RE.findall(reply):
+        decisions.setdefault(int(number), {"match": verdict.lower() == "yes", "reason": reason.strip()})
+    missing = sum(1 for i in range(1, len(texts) + 1) if i not in decisions)
+    if missing:
+        print(f"Batched LLM reply covered {len(texts) - missing}/{len(texts)} posts; deciding {missing} individually.")
+    return [
+        decisions.get(i) or {"match": is_match_via_llm(prompt, text), "reason": ""}
+        for i, text in enumerate(texts, start=1)
+    ]
+
+
+def submit_batch_decisions(
+    prompt: str,
+    texts: List[str],
+    model: str = "gpt-4o-mini",
+    max_tokens: int = 10,
+    poll_seconds: int = 60,
+) -> List[Dict[str, Any]]:
+    """
+    Decide yes/no for many posts through the OpenAI Batch API.
+
+    Writes one chat-completions request per post to a JSONL file, uploads it,
+    creates a batch, polls it until it finishes, and maps results back by
+    custom_id. Batches cost about half as much but may take up to 24 hours, so
+    this suits scheduled runs only.
+
+    Args:
+        prompt: Decision prompt applied to every post.
+        texts: Post texts to evaluate.
+        model: Model name to call.
+        max_tokens: Maximum tokens to generate per decision.
+        poll_seconds: Seconds to wait between batch status checks.
+
+    Returns:
+        One {"match": bool, "reason": str} dict per text, in input order. Posts
+        without a result are treated as no match.
+
+    Raises:
+        RuntimeError: If OPENAI_API_KEY is missing, a request fails, or the
+            batch does not complete.
+    """
+    if not texts:
+        return []
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY is required for ChatGPT calls.")
+    headers = {"Authorization": f"Bearer {api_key}"}
+
+    lines = [
+        json_dumps(
+            {
+                "custom_id": f"post-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [
+                        {"role": "system", "content": prompt},
+                        {"role": "user", "content": text},
+                    ],
+                    "max_tokens": max_tokens,
+                },
+            }
+        )
+        for i, text in enumerate(texts)
+    ]
+    upload = _OPENAI_SESSION.post(
+        f"{OPENAI_API_BASE}/files",
+        headers=headers,
+        data={"purpose": "batch"},
+        files={"file": ("decisions.jsonl", b"\n".join(lines), "application/jsonl")},
+        timeout=60,
+    )
+    if not upload.ok:
+        raise RuntimeError(f"OpenAI file upload error {upload.status_code}: {upload.text}")
+
+    created = _OPENAI_SESSION.post(
+        f"{OPENAI_API_BASE}/batches",
+        headers={**headers, "Content-Type": "application/json"},
+        data=json_dumps(
+            {
+                "input_file_id": json_loads(upload.content)["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            }
+        ),
+        timeout=30,
+    )
+    if not created.ok:
+        raise RuntimeError(f"OpenAI batch create error {created.status_code}: {created.text}")
+    batch = json_loads(created.content)
+
+    while batch.get("status") not in _BATCH_DONE_STATUSES:
+        print(f"OpenAI batch {batch['id']} is {batch.get('status')}; checking again in {poll_seconds}s.")
+        time.sleep(poll_seconds)
+        status = _OPENAI_SESSION.get(f"{OPENAI_API_BASE}/batches/{batch['id']}", headers=headers, timeout=30)
+        if not status.ok:
+            raise RuntimeError(f"OpenAI batch status error {status.status_code}: {status.text}")
+        batch = json_loads(status.content)
+    if batch["status"] != "completed" or not batch.get("output_file_id"):
+        raise RuntimeError(f"OpenAI batch {batch['id']} ended with status '{batch['status']}'.")
+
+    output = _OPENAI_SESSION.get(
+        f"{OPENAI_API_BASE}/files/{batch['output_file_id']}/content", headers=headers, timeout=60
+    )
+    if not output.ok:
+        raise RuntimeError(f"OpenAI batch output error {output.status_code}: {output.text}")
+
+    replies: Dict[str, str] = {}
+    for line in output.content.splitlines():
+        if not line.strip():
+            continue
+        result = json_loads(line)
+        body = (result.get("response") or {}).get("body") or {}
+        choices = body.get("choices") or []
+        if choices:
+            replies[result["custom_id"]] = choices[0]["message"]["content"].strip()
+
+    decisions: List[Dict[str, Any]] = []
+    for i in range(len(texts)):
+        reply = replies.get(f"post-{i}", "")
+        decisions.append({"match": "yes" in reply.lower(), "reason": reply})
+    return decisions
+
+
 def generate_reply_recommendation(post_text: str, prompt: str) -> str:
     """
     Produce a concise, humanized reply recommendation for a given post.
@@ -329,10 +625,50 @@ def generate_reply_recommendation(post_text: str, prompt: str) -> str:
         return "No recommendation generated."
 
 
+def _live_reload() -> bool:
+    """Return True when SHEETS_LIVE_RELOAD asks for prompts/content to be re-read each call."""
+    return os.getenv("SHEETS_LIVE_RELOAD", "false").lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=16)
+def _load_content(sheet_id: str, worksheet_name: str) -> str:
+    """Read and join the content sheet's first column; cached per (sheet, worksheet)."""
+    from x_auto.sheets.client import get_sheet_client
+
+    client = get_sheet_client("content_sheet", sheet_id)
+    ws = client.get_sheet(worksheet_name)
+    values = ws.col_values(1)
+    # Skip header and join meaningful rows.
+    content_lines = [v for v in values[1:] if v]
+    if not content_lines and values:
+        content_lines = [values[0]]
+    if not content_lines:
+        raise RuntimeError("No content found in the first column of the content sheet.")
+    return "\n".join(content_lines)
+
+
+@lru_cache(maxsize=16)
+def _load_prompts(sheet_id: str, worksheet_name: str) -> Tuple[Tuple[str, str], ...]:
+    """Read (name, prompt) pairs from the prompts sheet; cached per (sheet, worksheet)."""
+    from x_auto.sheets.client import get_sheet_client
+
+    client = get_sheet_client("prompts_sheet", sheet_id)
+    pairs: List[Tuple[str, str]] = []
+    for row in client.read_records_fast(worksheet_name):
+        name = str(row.get("name") or "").strip()
+        prompt_val = str(row.get("prompt") or "").strip()
+        if name and prompt_val:
+            pairs.append((name, prompt_val))
+    return tuple(pairs)
+
+
 def get_content_provided() -> str:
     """
     Load reference content from a separate Google Sheet (first column).
 
+    The sheet is read once per process; set SHEETS_LIVE_RELOAD=true to re-read
+    it on every call.
+
     Uses env:
         - GOOGLE_X_CONTENT_SHEET_ID: Spreadsheet ID holding reference content.
         - GOOGLE_X_CONTENT_WORKSHEET: Worksheet name (default: 'content').
@@ -348,16 +684,9 @@ def get_content_provided() -> str:
         raise RuntimeError("GOOGLE_X_CONTENT_SHEET_ID is required for content lookup.")
 
     worksheet_name = os.getenv("GOOGLE_X_CONTENT_WORKSHEET", "content")
-    client = GoogleSheetsClient(spreadsheet_name="content_sheet", spreadsheet_id=content_sheet_id)
-    ws = client.get_sheet(worksheet_name)
-    values = ws.col_values(1)
-    # Skip header and join meaningful rows.
-    content_lines = [v for v in values[1:] if v]
-    if not content_lines and values:
-        content_lines = [values[0]]
-    if not content_lines:
-        raise RuntimeError("No content found in the first column of the content sheet.")
-    return "\n".join(content_lines)
+    if _live_reload():
+        _load_content.cache_clear()
+    return _load_content(content_sheet_id, worksheet_name)
 
 
 def get_prompts_from_sheet() -> Dict[str, str]:
@@ -365,27 +694,86 @@ def get_prompts_from_sheet() -> Dict[str, str]:
     Load prompts from a dedicated prompts sheet.
 
     Expects columns: name, prompt (first row as header). Returns a mapping.
-    Falls back to defaults if env not set or sheet unreadable.
+    Falls back to defaults if env not set or sheet unreadable. Successful reads
+    are cached per process unless SHEETS_LIVE_RELOAD is set.
     """
     prompts_sheet_id = os.getenv("GOOGLE_X_PROMPTS_SHEET_ID")
     if not prompts_sheet_id:
         return {}
     worksheet_name = os.getenv("GOOGLE_X_PROMPTS_WORKSHEET", "prompts")
+    if _live_reload():
+        _load_prompts.cache_clear()
     try:
-        client = GoogleSheetsClient(spreadsheet_name="prompts_sheet", spreadsheet_id=prompts_sheet_id)
-        ws = client.get_sheet(worksheet_name)
-        records = ws.get_all_records()
-        prompt_map: Dict[str, str] = {}
-        for row in records:
-            name = str(row.get("name") or "").strip()
-            prompt_val = str(row.get("prompt") or "").strip()
-            if name and prompt_val:
-                prompt_map[name] = prompt_val
-        return prompt_map
+        return dict(_load_prompts(prompts_sheet_id, worksheet_name))
     except Exception:
         return {}
 
 
+def llm_skip_reason(text: str, min_chars: int = 20) -> Optional[str]:
+    """
+    Cheap pre-filter for posts that are not worth an LLM call.
+
+    Args:
+        text: Post text to check.
+        min_chars: Minimum length worth evaluating, measured with X's weighted
+            count so CJK characters count double and a short but complete
+            Chinese or Japanese sentence is not dropped.
+
+    Returns:
+        A short reason ("short", "retweet", "no-words", "links-only") when the
+        post should be skipped, otherwise None.
+    """
+    stripped = text.strip()
+    if stripped.startswith("RT @"):
+        return "retweet"
+    if _NO_WORDS_RE.fullmatch(stripped):
+        return "no-words"
+    if _URLS_ONLY_RE.fullmatch(stripped):
+        return "links-only"
+    # The weighted scan only runs for texts that are short by code points.
+    if len(stripped) < min_chars and weighted_length(stripped) < min_chars:
+        return "short"
+    return None
+
+
+def decide_and_draft(text: str, base_prompt: str, reply_prompt: str) -> Optional[str]:
+    """
+    Ask the LLM whether a post text matches and draft a reply if it does.
+
+    Args:
+        text: Post text to evaluate.
+        base_prompt: Decision prompt passed to `is_match_via_llm`.
+        reply_prompt: Prompt used to draft the reply recommendation.
+
+    Returns:
+        The reply recommendation for a match, or None when the LLM says no.
+    """
+    if not is_match_via_llm(base_prompt, text):
+        return None
+    return generate_reply_recommendation(text, prompt=reply_prompt)
+
+
+def build_match_record(url: str, post: Dict[str, Any], reply_reco: str) -> Dict[str, Any]:
+    """
+    Package a matching post and its drafted reply as an output record.
+
+    Args:
+        url: Profile URL the post was scraped from.
+        post: Matching post dictionary.
+        reply_reco: Reply recommendation drafted for the post's text.
+
+    Returns:
+        The output record consumed by the sheet writer.
+    """
+    return {
+        "profile_url": url,
+        "post": post,
+        "reply_reco": reply_reco,
+        "post_id": post.get("id") or post.get("postId") or "",
+        "timestamp": post.get("timestamp"),
+    }
+
+
 def format_timestamp(ts: Any) -> str:
     """
     Convert a millisecond timestamp to an ISO8601 string (UTC).
@@ -408,12 +796,17 @@ def run_scrape_and_filter() -> List[Dict[str, Any]]:
     Returns:
         List of matched post dictionaries.
     """
+    from scrapers.apify_client import fetch_posts_streaming
+    from x_auto.sheets.client import GoogleSheetsClient, get_sheet_client
+
     load_env()
     sheet_client = GoogleSheetsClient(spreadsheet_name=os.getenv("GOOGLE_SPREADSHEET_NAME", "Automation Config"))
     profile_urls = get_profile_urls(sheet_client)
     max_profiles = int(os.getenv("MAX_PROFILE_URLS", "0") or 0)
     batch_start = int(os.getenv("PROFILE_BATCH_START", "0") or 0)
     batch_size = int(os.getenv("PROFILE_BATCH_SIZE", "0") or 0)
+    post_limit = int(os.getenv("POST_RESULTS_LIMIT", "5") or 5)
+    lookback_days = int(os.getenv("LOOKBACK_DAYS", "30") or 30)
     total_profiles = len(profile_urls)
 
     # Apply batch slicing first if batch_size is set.
@@ -431,64 +824,133 @@ def run_scrape_and_filter() -> List[Dict[str, Any]]:
 
     # Build LLM prompts from the prompts sheet (or defaults).
     prompt_map = get_prompts_from_sheet()
-    base_prompt = prompt_map.get(
-        "match_prompt",
-        'You are a professional liquid fund investor, please see if this content has the similar information as the '
-        '"content provided" or is related to an industry, token analysis that would help investment. '
-        'Respond with "yes" or "no".',
-    )
-    reply_prompt = prompt_map.get(
-        "reply_prompt",
-        "You craft concise, human replies for a professional liquid fund account. "
-        "Read the user's post and propose a short, friendly reply that adds value, "
-        "acknowledges the topic, and avoids hype. Use relevant domain knowledge if helpful. "
-        "Keep it under 100 words (aim for brevity). "
-        "Do not include placeholders or ask for more info. Return only the reply text.",
-    )
-
-    matched: List[Dict[str, Any]] = []
-    matched_with_profile: List[Dict[str, Any]] = []
-    total_posts = 0
+    base_prompt = prompt_map.get("match_prompt", DEFAULT_MATCH_PROMPT)
+    reply_prompt = prompt_map.get("reply_prompt", DEFAULT_REPLY_PROMPT)
+    # Reference content is read once and folded into the decision prompt here,
+    # so every call shares one stable system-message prefix (which OpenAI's
+    # prompt caching can reuse) instead of re-reading or re-sending it per post.
+    if os.getenv("GOOGLE_X_CONTENT_SHEET_ID"):
+        try:
+            base_prompt = f"{base_prompt}\n\nContent provided:\n{get_content_provided()}"
+        except Exception as exc:  # noqa: BLE001
+            print(f"Reference content unavailable; matching without it: {exc}")
+
+    # Each LLM call is a blocking HTTPS round trip, so posts are evaluated
+    # concurrently; results are reassembled in profile order afterwards.
+    llm_workers = max(1, int(os.getenv("LLM_CONCURRENCY", "8") or 8))
+    apify_workers = max(1, int(os.getenv("APIFY_CONCURRENCY", "5") or 5))
+    # LLM_BATCH_SIZE > 1 packs that many posts into each decision request.
+    llm_batch_size = max(1, int(os.getenv("LLM_BATCH_SIZE", "1") or 1))
+    # OPENAI_USE_BATCH_API=1 sends decisions through the (slow, cheaper) Batch API.
+    use_batch_api = os.getenv("OPENAI_USE_BATCH_API", "").lower() in {"1", "true", "yes"}
+    # Per-post decisions start as soon as a profile's posts arrive, overlapping
+    # Apify waits with OpenAI waits; batched modes need every text up front.
+    streaming = not use_batch_api and llm_batch_size == 1
+    min_post_chars = int(os.getenv("MIN_POST_CHARS", "20") or 0)
+
+    # Profile URL -> merged candidate posts, each with its llm_skip_reason (None = evaluate).
+    candidates_by_url: Dict[str, List[Tuple[Dict[str, Any], Optional[str]]]] = {}
+    # Identical texts (reposts shared by several profiles) are decided and
+    # drafted once per run, then fanned back out to every post carrying them.
+    reply_futures: Dict[str, Future] = {}
     recent_posts = 0
     reply_posts = 0
-    post_limit = int(os.getenv("POST_RESULTS_LIMIT", "5") or 5)
-    for idx, url in enumerate(profile_urls, start=1):
-        print(f"[{idx}/{len(profile_urls)}] Fetching posts for {url}")
-        posts = fetch_posts([url], results_limit=post_limit)
-        total_posts += len(posts)
-        lookback_days = int(os.getenv("LOOKBACK_DAYS", "30") or 30)
-        recent = [p for p in posts if is_recent_post(p, days=lookback_days)]
-        recent_posts += len(recent)
-        replies = [p for p in recent if is_reply(p)]
-        reply_posts += len(replies)
-        # Merge by conversation id and 2-minute window; include originals if no replies found.
-        to_merge = replies if replies else recent
-        merged_recent = merge_threaded_posts(to_merge)
-        for post in merged_recent:
-            text = post.get("text") or post.get("postText") or ""
-            if not text:
-                continue
-            if is_match_via_llm(base_prompt, text):
-                matched.append(post)
-                recommendation = generate_reply_recommendation(text, prompt=reply_prompt)
-                matched_with_profile.append(
-                    {
-                        "profile_url": url,
-                        "post": post,
-                        "reply_reco": recommendation,
-                        "post_id": post.get("id") or post.get("postId") or "",
-                        "timestamp": post.get("timestamp"),
-                    }
+    cutoff_ms = recent_cutoff_ms(lookback_days)
+
+    def fetch_recent(url: str) -> List[Dict[str, Any]]:
+        # Dataset pages are read newest first and paging stops once a page has
+        # nothing inside the lookback window, so older posts are never downloaded.
+        return list(
+            fetch_posts_streaming(
+                [url],
+                results_limit=post_limit,
+                is_recent=lambda post: is_recent_post(post, cutoff_ms=cutoff_ms),
+            )
+        )
+
+    print(f"Fetching posts for {len(profile_urls)} profiles concurrently.")
+    with ThreadPoolExecutor(max_workers=llm_workers, thread_name_prefix="llm") as executor:
+        with ThreadPoolExecutor(max_workers=apify_workers, thread_name_prefix="apify") as apify_pool:
+            fetches = {apify_pool.submit(fetch_recent, url): url for url in profile_urls}
+            for idx, fetched in enumerate(as_completed(fetches), start=1):
+                url = fetches[fetched]
+                posts = [_canonicalize_post(p) for p in fetched.result()]
+                print(f"[{idx}/{len(profile_urls)}] Processing {len(posts)} recent posts for {url}")
+                recent_posts += len(posts)
+                replies = [p for p in posts if is_reply(p)]
+                reply_posts += len(replies)
+                # Merge by conversation id and 2-minute window; include originals if no replies found.
+                to_merge = replies if replies else posts
+                # The pre-LLM skip check runs once per post; its result travels with it.
+                candidates = [
+                    (post, llm_skip_reason(post["text"], min_post_chars))
+                    for post in merge_threaded_posts(to_merge)
+                ]
+                candidates_by_url[url] = candidates
+                if not streaming:
+                    continue
+                for post, skip_reason in candidates:
+                    text = post["text"]
+                    if text and text not in reply_futures and not skip_reason:
+                        reply_futures[text] = executor.submit(
+                            decide_and_draft, text, base_prompt, reply_prompt
+                        )
+
+        with_text: List[Tuple[str, Dict[str, Any]]] = []
+        skipped = 0
+        for url in profile_urls:
+            for post, skip_reason in candidates_by_url.get(url, []):
+                if not post["text"]:
+                    continue
+                if skip_reason:
+                    skipped += 1
+                    continue
+                with_text.append((url, post))
+        if skipped:
+            print(f"Skipped {skipped} short, retweet, or symbol-only posts before the LLM.")
+        texts = list(dict.fromkeys(post["text"] for _, post in with_text))
+        print(
+            f"Evaluating {len(with_text)} posts ({len(texts)} distinct texts) via LLM "
+            f"({llm_workers} concurrent, batch={llm_batch_size})."
+        )
+        if streaming:
+            drafts = {text: future.result() for text, future in reply_futures.items()}
+            reply_by_text = {text: reply for text, reply in drafts.items() if reply is not None}
+        else:
+            if use_batch_api:
+                decisions = [d["match"] for d in submit_batch_decisions(base_prompt, texts)]
+            else:
+                chunks = [texts[i : i + llm_batch_size] for i in range(0, len(texts), llm_batch_size)]
+                decisions = [
+                    d["match"]
+                    for chunk_decisions in executor.map(
+                        lambda chunk: get_llm_decisions_batch(base_prompt, chunk), chunks
+                    )
+                    for d in chunk_decisions
+                ]
+            matched_texts = [text for text, is_match in zip(texts, decisions) if is_match]
+            reply_by_text = dict(
+                zip(
+                    matched_texts,
+                    executor.map(
+                        lambda text: generate_reply_recommendation(text, prompt=reply_prompt), matched_texts
+                    ),
                 )
+            )
+    matched_with_profile = [
+        build_match_record(url, post, reply_by_text[text])
+        for url, post in with_text
+        if (text := post["text"]) in reply_by_text
+    ]
+    matched = [item["post"] for item in matched_with_profile]
 
     # For now, print a simple summary and return the matches for caller use.
-    print(f"Total posts fetched: {total_posts}")
-    print(f"Posts within last 30 days: {recent_posts}")
+    print(f"Posts within last {lookback_days} days: {recent_posts}")
     print(f"Replies considered (<=2 min merge per author): {reply_posts}")
     print(f"Matched (LLM yes) posts: {len(matched)}")
     for idx, post in enumerate(matched, 1):
         pid = post.get("id") or post.get("postId")
-        preview = (post.get("text") or post.get("postText") or "")[:140].replace("\n", " ")
+        preview = post["text"][:140].replace("\n", " ")
         print(f"{idx}. {pid}: {preview!r}")
 
     # Persist matches to output sheet if configured.
@@ -496,40 +958,37 @@ def run_scrape_and_filter() -> List[Dict[str, Any]]:
     output_ws_name = os.getenv("GOOGLE_X_SCRAPE_OUTPUT_WORKSHEET", "scrape_output")
     if output_sheet_id and matched_with_profile:
         try:
-            out_client = GoogleSheetsClient(
-                spreadsheet_name="scrape_output",
-                spreadsheet_id=output_sheet_id,
-            )
+            out_client = get_sheet_client("scrape_output", output_sheet_id)
             ws = out_client.get_sheet(output_ws_name)
-            existing = ws.get_all_values()
-
-            def normalize_row(row: List[str]) -> List[str]:
-                # Shift left if leading blanks exist.
-                normalized = list(row)
-                while normalized and normalized[0] == "":
-                    normalized = normalized[1:]
-                return normalized
-
-            if not any(cell for r in existing for cell in r):
-                ws.append_row(
-                    ["profile_url", "post_content", "timestamp_ms", "reply_recommendation", "post_link"],
-                    value_input_option="USER_ENTERED",
-                )
+            cache_key = (output_sheet_id, output_ws_name)
+            cached = _OUTPUT_DEDUP_CACHE.get(cache_key)
+            if cached is not None:
+                has_content, existing_pairs = cached
+            else:
                 existing = ws.get_all_values()
 
-            existing_pairs = set()
-            for row in existing[1:]:
-                norm = normalize_row(row)
-                if len(norm) >= 3:
-                    existing_pairs.add((norm[0].strip(), norm[1].strip(), norm[2].strip()))
+                def normalize_row(row: List[str]) -> List[str]:
+                    # Shift left if leading blanks exist.
+                    normalized = list(row)
+                    while normalized and normalized[0] == "":
+                        normalized = normalized[1:]
+                    return normalized
+
+                has_content = any(cell for r in existing for cell in r)
+                existing_pairs = set()
+                for row in existing[1:]:
+                    norm = normalize_row(row)
+                    if len(norm) >= 3:
+                        existing_pairs.add((norm[0].strip(), norm[1].strip(), norm[2].strip()))
+                _OUTPUT_DEDUP_CACHE[cache_key] = (has_content, existing_pairs)
+            new_keys = set()
             rows = []
             for item in matched_with_profile:
                 post = item["post"]
                 profile_url = (item["profile_url"] or "").strip()
-                text = (post.get("text") or post.get("postText") or "").replace("\n", " ").strip()
+                text = post["text"].replace("\n", " ").strip()
                 reply_reco = item.get("reply_reco", "")
                 ts_raw = item.get("timestamp") or ""
-                ts_str = str(ts_raw) if ts_raw is not None else ""
                 ts_human = format_timestamp(ts_raw)
                 post_id = item.get("post_id", "")
                 post_link = (
@@ -537,12 +996,20 @@ def run_scrape_and_filter() -> List[Dict[str, Any]]:
                     or post.get("url")
                     or (f"https://x.com/i/web/status/{post_id}" if post_id else "")
                 )
-                key = (profile_url, text, ts_str)
-                if key in existing_pairs:
+                # The sheet stores the ISO timestamp, so that is what the key compares.
+                key = (profile_url, text, ts_human)
+                if key in existing_pairs or key in new_keys:
                     continue
+                new_keys.add(key)
                 rows.append([profile_url, text, ts_human, reply_reco, post_link])
             if rows:
-                ws.append_rows(rows, value_input_option="USER_ENTERED", table_range="A1")
+                # An empty sheet gets its header row in the same append as the data,
+                # so the whole write is one Sheets call with no re-read.
+                payload = rows if has_content else [OUTPUT_HEADERS] + rows
+                ws.append_rows(payload, value_input_option="USER_ENTERED", table_range="A1")
+                # Only keys that actually reached the sheet join the cached set.
+                existing_pairs |= new_keys
+                _OUTPUT_DEDUP_CACHE[cache_key] = (True, existing_pairs)
             print(f"Wrote {len(rows)} rows to output sheet '{output_ws_name}'.")
         except Exception as exc:  # noqa: BLE001
             print(f"Failed to write scrape output: {exc}")
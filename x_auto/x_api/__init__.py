@@ -2,4 +2,4 @@
 Client utilities for interacting with the X (Twitter) API.
 """
 
-from x_auto.x_api.x_client import post_reply  # noqa: F401
+from x_auto.x_api.x_client import post_replies, post_reply  # noqa: F401
@@ -13,13 +13,45 @@ Example:
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from requests_oauthlib import OAuth1
 
+from x_auto.utils.http import json_dumps, pooled_session
+from x_auto.utils.rate_limit import TokenBucket
+
 TWEETS_ENDPOINT = "https://api.twitter.com/2/tweets"
 
+# Keep-alive session shared by all replies so consecutive posts skip the TLS
+# handshake. urllib3 retries are off: it would resend the already-signed OAuth1
+# request, and X rejects the repeated nonce/timestamp as a replay. post_reply
+# retries itself instead, re-signing every attempt.
+_SESSION = pooled_session(pool_connections=1, pool_maxsize=8)
+
+# Attempts per reply. Only 429s and connect timeouts are retried: a 5xx or read
+# error after the POST may still have created the tweet, and retrying it could
+# publish a duplicate reply.
+_MAX_ATTEMPTS = 3
+_MAX_RETRY_WAIT_SECONDS = 60.0
+
+
+@lru_cache(maxsize=1)
+def _reply_bucket() -> Optional[TokenBucket]:
+    """
+    Shared limiter for reply posts, built on first use so `.env` is loaded by then.
+
+    X_REPLY_LIMIT_PER_15MIN (default 50) replies may burst; the budget refills
+    evenly over the 15-minute window. 0 disables the limit.
+    """
+    per_window = float(os.getenv("X_REPLY_LIMIT_PER_15MIN", "50") or 0)
+    if per_window <= 0:
+        return None
+    return TokenBucket(per_window / 900, per_window)
+
 
 def _get_auth() -> Dict[str, Optional[str]]:
     """
@@ -82,7 +114,9 @@ def post_reply(text: str, in_reply_to_post_id: str) -> Dict[str, Any]:
 
     Raises:
         RuntimeError: For missing credentials.
-        requests.HTTPError: For non-success HTTP responses.
+        requests.HTTPError: For non-success HTTP responses, including a 429
+            that persists after the retries.
+        requests.ConnectTimeout: If every connection attempt times out.
         ValueError: For JSON decoding errors in the API response.
     """
     auth_conf = _get_auth()
@@ -104,13 +138,24 @@ def post_reply(text: str, in_reply_to_post_id: str) -> Dict[str, Any]:
         "reply": {"in_reply_to_tweet_id": in_reply_to_post_id},
     }
 
-    response = requests.post(
-        TWEETS_ENDPOINT,
-        json=payload,
-        headers=headers,
-        auth=auth_obj,
-        timeout=30,
-    )
+    body = json_dumps(payload)
+    bucket = _reply_bucket()
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
+        if bucket is not None:
+            bucket.acquire()
+        try:
+            # Each call signs the request afresh (new OAuth1 nonce and timestamp).
+            response = _SESSION.post(TWEETS_ENDPOINT, data=body, headers=headers, auth=auth_obj, timeout=30)
+        except requests.ConnectTimeout:
+            if attempt == _MAX_ATTEMPTS:
+                raise
+            time.sleep(0.5 * 2**attempt)
+            continue
+        if response.status_code != 429 or attempt == _MAX_ATTEMPTS:
+            break
+        retry_after = response.headers.get("Retry-After", "")
+        wait = float(retry_after) if retry_after.isdigit() else 0.5 * 2**attempt
+        time.sleep(min(wait, _MAX_RETRY_WAIT_SECONDS))
 
     if not 200 <= response.status_code < 300:
         # Aid debugging by exposing returned headers (e.g., x-access-level).
@@ -122,3 +167,32 @@ def post_reply(text: str, in_reply_to_post_id: str) -> Dict[str, Any]:
         return response.json()
     except ValueError as exc:
         raise ValueError("Failed to decode X API response as JSON.") from exc
+
+
+def post_replies(items: List[Tuple[str, str]], max_workers: int = 4) -> List[Dict[str, Any]]:
+    """
+    Post several replies concurrently over the shared session.
+
+    Each reply still goes through `post_reply`, so the reply rate limit applies
+    across all workers; concurrency only overlaps the network round-trips.
+
+    Args:
+        items: (text, in_reply_to_post_id) pairs to publish.
+        max_workers: Maximum number of replies in flight at once.
+
+    Returns:
+        One entry per item, in input order: the parsed API response, or
+        {"error": "<message>"} when that reply failed.
+    """
+    if not items:
+        return []
+
+    def send(item: Tuple[str, str]) -> Dict[str, Any]:
+        text, in_reply_to_post_id = item
+        try:
+            return post_reply(text, in_reply_to_post_id)
+        except Exception as exc:  # noqa: BLE001 - one failed reply must not drop the others' results.
+            return {"error": str(exc)}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))), thread_name_prefix="x-reply") as pool:
+        return list(pool.map(send, items))